@@ -5,24 +5,42 @@ Handles loading and managing configuration settings for different environments
 
 import json
 import os
+import threading
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, Any
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class Config:
     """Singleton configuration manager for the framework"""
     
     _instance = None
     _config_data = None
+    _initialized = False
+    _lock = threading.Lock()
     
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(Config, cls).__new__(cls)
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super(Config, cls).__new__(cls)
         return cls._instance
     
     def __init__(self):
-        if self._config_data is None:
+        if self.__class__._initialized:
+            return
+        with self.__class__._lock:
+            if self.__class__._initialized:
+                return
             self._load_config()
+            self.refresh_env()
+            self.__class__._initialized = True
     
     def _load_config(self):
         """Load configuration from environments.json file"""
@@ -31,8 +49,25 @@ class Config:
         if not config_path.exists():
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
-        with open(config_path, 'r') as f:
-            self._config_data = json.load(f)
+        with open(config_path, 'rb') as f:
+            self._config_data = _json_loads(f.read())
+    
+    def refresh_env(self):
+        """
+        Re-read environment variables into the cached settings
+        
+        Call this after mutating BROWSER, HEADLESS, ENV or REMOTE_URL at runtime
+        """
+        self._browser = os.getenv('BROWSER', 'chrome').lower()
+        self._headless = os.getenv('HEADLESS', 'false').lower() == 'true'
+        self._environment = os.getenv('ENV', 'dev')
+        self._remote_url = os.getenv('REMOTE_URL') or None
+        self._worker_id = os.getenv('PYTEST_XDIST_WORKER')
+        self._active_env_config = self._config_data.get(self._environment)
+        
+        # Drop values memoized for the previous environment
+        for name in ('base_url', 'timeout'):
+            self.__dict__.pop(name, None)
     
     def get_env_config(self, env: str = None) -> Dict[str, Any]:
         """
@@ -44,13 +79,16 @@ class Config:
         Returns:
             Dictionary with environment configuration
         """
-        if env is None:
-            env = os.getenv('ENV', 'dev')
+        if env is None or env == self._environment:
+            env = self._environment
+            env_config = self._active_env_config
+        else:
+            env_config = self._config_data.get(env)
         
-        if env not in self._config_data:
+        if env_config is None:
             raise ValueError(f"Environment '{env}' not found in configuration")
         
-        return self._config_data[env]
+        return env_config
     
     def get(self, key: str, env: str = None, default: Any = None) -> Any:
         """
@@ -67,30 +105,53 @@ class Config:
         env_config = self.get_env_config(env)
         return env_config.get(key, default)
     
-    @property
+    def get_browser_options(self, browser: str) -> Dict[str, Any]:
+        """
+        Get browser options spec from configuration
+        
+        Args:
+            browser: Browser name (chrome, firefox, edge)
+        
+        Returns:
+            Dictionary with args, headless_args, experimental options,
+            preferences and page load strategy for the browser
+        """
+        return self._config_data.get('browser_options', {}).get(browser, {})
+    
+    @cached_property
     def base_url(self) -> str:
         """Get base URL for current environment"""
-        return self.get('base_url')
+        return self.get_env_config().get('base_url')
     
-    @property
+    @cached_property
     def timeout(self) -> int:
         """Get default timeout for current environment"""
-        return self.get('timeout', default=10)
+        return self.get_env_config().get('timeout', 10)
     
     @property
     def browser(self) -> str:
         """Get browser from environment variable or default"""
-        return os.getenv('BROWSER', 'chrome').lower()
+        return self._browser
     
     @property
     def headless(self) -> bool:
         """Check if browser should run in headless mode"""
-        return os.getenv('HEADLESS', 'false').lower() == 'true'
+        return self._headless
     
     @property
     def environment(self) -> str:
         """Get current environment name"""
-        return os.getenv('ENV', 'dev')
+        return self._environment
+    
+    @property
+    def remote_url(self) -> str:
+        """Get Selenium Grid / remote WebDriver URL, or None to run browsers locally"""
+        return self._remote_url
+    
+    @property
+    def worker_id(self) -> str:
+        """Get pytest-xdist worker id (gw0, gw1, ...), or None outside a worker process"""
+        return self._worker_id
 
 
 # Singleton instance
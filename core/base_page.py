@@ -8,10 +8,65 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException
+)
+from collections import OrderedDict
 from config.config import config
+from core.js_snippets import SET_NATIVE_VALUE_JS
 from utils.logger import logger
-from typing import List, Tuple
+from typing import Callable, List, Tuple
+
+
+# Maximum number of recently found elements kept per page object
+FIND_CACHE_SIZE = 8
+
+# WebDriver cookie fields that map one-to-one onto CDP Network.setCookie parameters
+_CDP_COOKIE_KEYS = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite')
+
+# JavaScript snippets used by the scroll/click helpers
+_SCROLL_INTO_VIEW_JS = "arguments[0].scrollIntoView(true);"
+_SCROLL_BOTTOM_JS = "window.scrollTo(0, document.body.scrollHeight);"
+_SCROLL_TOP_JS = "window.scrollTo(0, 0);"
+_JS_CLICK_JS = "arguments[0].click();"
+_SCROLL_AND_CLICK_JS = "arguments[0].scrollIntoView(true); arguments[0].click();"
+_SET_VALUE_JS = SET_NATIVE_VALUE_JS + "setNativeValue(arguments[0], arguments[1]);"
+_CLICK_ALL_JS = (
+    "const els = Array.from(document.querySelectorAll(arguments[0]))"
+    ".slice(0, arguments[1] === null ? undefined : arguments[1]);"
+    "els.forEach(e => e.click());"
+    "if (!arguments[2]) return els.length;"
+    "const b = document.querySelector('.shopping_cart_badge');"
+    "return [els.length, b ? parseInt(b.textContent, 10) || 0 : 0];"
+)
+_RESET_FORMS_JS = "document.querySelectorAll('form').forEach(f => f.reset());"
+_EXISTS_JS = "return document.querySelector(arguments[0]) !== null;"
+_CART_COUNT_JS = (
+    "const b = document.querySelector('.shopping_cart_badge');"
+    "return b ? parseInt(b.textContent, 10) || 0 : 0;"
+)
+_IS_ENABLED_JS = (
+    "const e = document.querySelector(arguments[0]);"
+    "return e ? {enabled: !e.disabled} : null;"
+)
+_ALL_VISIBLE_JS = (
+    "const find = ([by, v]) => by === 'id' ? document.getElementById(v)"
+    " : by === 'class name' ? document.getElementsByClassName(v)[0]"
+    " : by === 'name' ? document.getElementsByName(v)[0]"
+    " : by === 'tag name' ? document.getElementsByTagName(v)[0]"
+    " : by === 'xpath' ? document.evaluate(v, document, null,"
+    " XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue"
+    " : document.querySelector(v);"
+    "return arguments[0].every(l => { const e = find(l);"
+    " return !!e && e.getClientRects().length > 0"
+    " && getComputedStyle(e).visibility !== 'hidden'; });"
+)
+_TEXTS_BY_CSS_JS = (
+    "return Array.from(document.querySelectorAll(arguments[0]))"
+    ".map(e => e.textContent.trim());"
+)
 
 
 class BasePage:
@@ -25,14 +80,111 @@ class BasePage:
             driver: Selenium WebDriver instance
         """
         self.driver = driver
-        self.wait = WebDriverWait(driver, config.timeout)
-        self.actions = ActionChains(driver)
+        self._default_timeout = config.timeout
+        self.wait = WebDriverWait(driver, self._default_timeout)
+        self._wait_cache = {}
+        self._find_cache = OrderedDict()
+    
+    @property
+    def actions(self) -> ActionChains:
+        """Fresh ActionChains for a single gesture, so no actions leak between calls"""
+        return ActionChains(self.driver)
+    
+    def _resolve_timeout(self, timeout: int = None) -> int:
+        """Return the given timeout, or the page default when not provided"""
+        return timeout if timeout is not None else self._default_timeout
+    
+    def _wait(self, timeout: int = None) -> WebDriverWait:
+        """
+        Get a WebDriverWait for the given timeout, reusing cached instances
+        
+        Args:
+            timeout: Custom timeout in seconds (defaults to config timeout)
+        
+        Returns:
+            WebDriverWait instance
+        """
+        timeout = self._resolve_timeout(timeout)
+        if timeout == self._default_timeout:
+            return self.wait
+        wait = self._wait_cache.get(timeout)
+        if wait is None:
+            wait = WebDriverWait(self.driver, timeout)
+            self._wait_cache[timeout] = wait
+        return wait
+    
+    def _invalidate_caches(self):
+        """Drop cached elements (called whenever the document or context changes)"""
+        self._find_cache.clear()
+    
+    def _find_cached(self, locator: Tuple[By, str], timeout: int = None):
+        """
+        Find element, reusing the element found for the same locator recently
+        
+        Args:
+            locator: Tuple of (By, locator_value)
+            timeout: Custom timeout in seconds
+        
+        Returns:
+            WebElement
+        """
+        key = (self.driver.session_id, locator)
+        element = self._find_cache.get(key)
+        if element is not None:
+            self._find_cache.move_to_end(key)
+            return element
+        element = self.find_element(locator, timeout)
+        self._find_cache[key] = element
+        if len(self._find_cache) > FIND_CACHE_SIZE:
+            self._find_cache.popitem(last=False)
+        return element
+    
+    def _with_element(self, locator: Tuple[By, str], action: Callable, timeout: int = None):
+        """
+        Run action on a (possibly cached) element, re-finding it once if stale
+        
+        Args:
+            locator: Tuple of (By, locator_value)
+            action: Callable receiving the WebElement
+            timeout: Custom timeout in seconds
+        
+        Returns:
+            Result of action
+        """
+        element = self._find_cached(locator, timeout)
+        try:
+            return action(element)
+        except StaleElementReferenceException:
+            self._find_cache.pop((self.driver.session_id, locator), None)
+            return action(self._find_cached(locator, timeout))
     
     # Navigation Methods
     
+    def add_cookies(self, cookies: List[dict]):
+        """
+        Add cookies (as returned by driver.get_cookies()) to the browser
+        
+        Chromium drivers set them through CDP Network.setCookie, which needs no
+        page of the cookie's domain to be loaded first. Other drivers fall back
+        to WebDriver add_cookie, so the current page must be on that domain.
+        
+        Args:
+            cookies: Cookie dicts with at least name, value and domain
+        """
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            for cookie in cookies:
+                params = {key: cookie[key] for key in _CDP_COOKIE_KEYS if key in cookie}
+                if 'expiry' in cookie:
+                    params['expires'] = cookie['expiry']
+                self.driver.execute_cdp_cmd("Network.setCookie", params)
+        else:
+            for cookie in cookies:
+                self.driver.add_cookie(cookie)
+    
     def navigate_to(self, url: str):
         """Navigate to specific URL"""
-        logger.info(f"Navigating to: {url}")
+        logger.info("Navigating to: %s", url)
+        self._invalidate_caches()
         self.driver.get(url)
     
     def navigate_to_base_url(self):
@@ -50,16 +202,29 @@ class BasePage:
     def refresh_page(self):
         """Refresh the current page"""
         logger.info("Refreshing page")
+        self._invalidate_caches()
         self.driver.refresh()
     
+    def reset_forms(self):
+        """
+        Reset every form on the page to its initial values without reloading
+        
+        Cheaper than refresh_page when a test only needs clean form state.
+        The DOM is kept, so cached elements stay valid.
+        """
+        logger.info("Resetting forms")
+        self.driver.execute_script(_RESET_FORMS_JS)
+    
     def go_back(self):
         """Navigate back in browser history"""
         logger.info("Navigating back")
+        self._invalidate_caches()
         self.driver.back()
     
     def go_forward(self):
         """Navigate forward in browser history"""
         logger.info("Navigating forward")
+        self._invalidate_caches()
         self.driver.forward()
     
     # Element Finding Methods
@@ -75,15 +240,14 @@ class BasePage:
         Returns:
             WebElement if found
         """
-        timeout = timeout or config.timeout
         try:
-            element = WebDriverWait(self.driver, timeout).until(
+            element = self._wait(timeout).until(
                 EC.presence_of_element_located(locator)
             )
-            logger.debug(f"Element found: {locator}")
+            logger.debug("Element found: %s", locator)
             return element
         except TimeoutException:
-            logger.error(f"Element not found: {locator}")
+            logger.error("Element not found: %s", locator)
             raise
     
     def find_elements(self, locator: Tuple[By, str], timeout: int = None) -> List:
@@ -97,30 +261,31 @@ class BasePage:
         Returns:
             List of WebElements
         """
-        timeout = timeout or config.timeout
         try:
-            elements = WebDriverWait(self.driver, timeout).until(
+            elements = self._wait(timeout).until(
                 EC.presence_of_all_elements_located(locator)
             )
-            logger.debug(f"Found {len(elements)} elements: {locator}")
+            logger.debug("Found %d elements: %s", len(elements), locator)
             return elements
         except TimeoutException:
-            logger.error(f"Elements not found: {locator}")
+            logger.error("Elements not found: %s", locator)
             return []
     
-    def is_element_present(self, locator: Tuple[By, str], timeout: int = 5) -> bool:
+    def is_element_present(self, locator: Tuple[By, str], timeout: int = 0) -> bool:
         """
         Check if element is present on page
         
         Args:
             locator: Tuple of (By, locator_value)
-            timeout: Custom timeout in seconds
+            timeout: Custom timeout in seconds (0 checks once without waiting)
         
         Returns:
             True if element present, False otherwise
         """
+        if timeout == 0:
+            return len(self.driver.find_elements(*locator)) > 0
         try:
-            WebDriverWait(self.driver, timeout).until(
+            self._wait(timeout).until(
                 EC.presence_of_element_located(locator)
             )
             return True
@@ -133,35 +298,114 @@ class BasePage:
         
         Args:
             locator: Tuple of (By, locator_value)
-            timeout: Custom timeout in seconds
+            timeout: Custom timeout in seconds (0 checks once without waiting)
         
         Returns:
             True if element visible, False otherwise
         """
-        timeout = timeout or config.timeout
+        if timeout == 0:
+            elements = self.driver.find_elements(*locator)
+            try:
+                return bool(elements) and elements[0].is_displayed()
+            except StaleElementReferenceException:
+                return False
         try:
-            WebDriverWait(self.driver, timeout).until(
+            self._wait(timeout).until(
                 EC.visibility_of_element_located(locator)
             )
             return True
         except TimeoutException:
             return False
     
+    def js_exists(self, css_selector: str) -> bool:
+        """
+        Check if element exists right now, with one script call and no polling
+        
+        Args:
+            css_selector: CSS selector
+        
+        Returns:
+            True if a matching element is in the DOM
+        """
+        return self.driver.execute_script(_EXISTS_JS, css_selector)
+    
+    def js_cart_count(self) -> int:
+        """
+        Get the shopping cart badge count with one script call and no polling
+        
+        Returns:
+            Number shown on the cart badge (0 when the badge is absent)
+        """
+        return int(self.driver.execute_script(_CART_COUNT_JS) or 0)
+    
+    def js_is_enabled(self, css_selector: str, timeout: int = None) -> bool:
+        """
+        Check if element is enabled with one script call per poll
+        
+        Waits for the element to be present, like find_element, but reads
+        presence and enabled state together instead of in two requests.
+        
+        Args:
+            css_selector: CSS selector (e.g. "#login-button")
+            timeout: Custom timeout in seconds
+        
+        Returns:
+            True if element is enabled
+        """
+        try:
+            state = self._wait(timeout).until(
+                lambda driver: driver.execute_script(_IS_ENABLED_JS, css_selector)
+            )
+            return state['enabled']
+        except TimeoutException:
+            logger.error("Element not found: %s", css_selector)
+            raise
+    
+    def wait_all_visible(self, locators: List[Tuple[By, str]], timeout: int = None) -> bool:
+        """
+        Wait until all elements are visible, checking them together in one script call per poll
+        
+        Visibility is evaluated in the browser (rendered box, not visibility:hidden),
+        so the cost per poll does not grow with the number of locators. Supports
+        ID, CLASS_NAME, NAME, TAG_NAME, XPATH and CSS_SELECTOR locators.
+        
+        Args:
+            locators: List of (By, locator_value) tuples
+            timeout: Custom timeout in seconds
+        
+        Returns:
+            True if all elements visible, False otherwise
+        """
+        unsupported = [locator for locator in locators if locator[0] in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT)]
+        if unsupported:
+            raise ValueError(f"Unsupported locator strategy for wait_all_visible: {unsupported}")
+        try:
+            self._wait(timeout).until(
+                lambda driver: driver.execute_script(_ALL_VISIBLE_JS, [list(locator) for locator in locators])
+            )
+            return True
+        except TimeoutException:
+            return False
+    
     # Element Interaction Methods
     
-    def click(self, locator: Tuple[By, str], timeout: int = None):
+    def click(self, locator: Tuple[By, str], timeout: int = None, skip_wait: bool = False):
         """
         Click on element
         
         Args:
             locator: Tuple of (By, locator_value)
             timeout: Custom timeout in seconds
+            skip_wait: Click without waiting for clickability, for elements the
+                caller has just waited on
         """
-        timeout = timeout or config.timeout
-        element = WebDriverWait(self.driver, timeout).until(
-            EC.element_to_be_clickable(locator)
-        )
-        logger.info(f"Clicking element: {locator}")
+        if skip_wait:
+            element = self.driver.find_element(*locator)
+        else:
+            element = self._wait(timeout).until(
+                EC.element_to_be_clickable(locator)
+            )
+        logger.info("Clicking element: %s", locator)
         element.click()
     
     def type_text(self, locator: Tuple[By, str], text: str, timeout: int = None, clear_first: bool = True):
@@ -174,11 +418,34 @@ class BasePage:
             timeout: Custom timeout in seconds
             clear_first: Clear field before typing
         """
-        element = self.find_element(locator, timeout)
-        if clear_first:
-            element.clear()
-        logger.info(f"Typing text into element: {locator}")
-        element.send_keys(text)
+        def _type(element):
+            if clear_first:
+                element.clear()
+            element.send_keys(text)
+        
+        logger.info("Typing text into element: %s", locator)
+        self._with_element(locator, _type, timeout)
+    
+    def fast_set_value(self, locator: Tuple[By, str], text: str, timeout: int = None):
+        """
+        Set input value with a single JavaScript call
+        
+        Replaces the field value through the native value setter (so React-controlled
+        inputs pick it up) and fires input/change events in one round trip,
+        regardless of text length. No keystroke events are sent, so use type_text
+        for fields that react to individual key presses.
+        
+        Args:
+            locator: Tuple of (By, locator_value)
+            text: Value to set
+            timeout: Custom timeout in seconds
+        """
+        logger.info("Setting value of element: %s", locator)
+        self._with_element(
+            locator,
+            lambda element: self.driver.execute_script(_SET_VALUE_JS, element, text),
+            timeout
+        )
     
     def get_text(self, locator: Tuple[By, str], timeout: int = None) -> str:
         """
@@ -191,11 +458,33 @@ class BasePage:
         Returns:
             Element text
         """
-        element = self.find_element(locator, timeout)
-        text = element.text
-        logger.debug(f"Got text from element {locator}: {text}")
+        text = self._with_element(locator, lambda element: element.text, timeout)
+        logger.debug("Got text from element %s: %s", locator, text)
         return text
     
+    def get_texts_by_css(self, css_selector: str, timeout: int = None) -> List[str]:
+        """
+        Get text of all elements matching a CSS selector in one script call
+        
+        Waits until at least one element matches, like find_elements.
+        
+        Args:
+            css_selector: CSS selector
+            timeout: Custom timeout in seconds
+        
+        Returns:
+            List of trimmed text contents (empty if nothing matched in time)
+        """
+        try:
+            texts = self._wait(timeout).until(
+                lambda driver: driver.execute_script(_TEXTS_BY_CSS_JS, css_selector) or False
+            )
+            logger.debug("Read %d texts: %s", len(texts), css_selector)
+            return texts
+        except TimeoutException:
+            logger.error("Elements not found: %s", css_selector)
+            return []
+    
     def get_attribute(self, locator: Tuple[By, str], attribute: str, timeout: int = None) -> str:
         """
         Get attribute value from element
@@ -208,16 +497,14 @@ class BasePage:
         Returns:
             Attribute value
         """
-        element = self.find_element(locator, timeout)
-        value = element.get_attribute(attribute)
-        logger.debug(f"Got attribute '{attribute}' from element {locator}: {value}")
+        value = self._with_element(locator, lambda element: element.get_attribute(attribute), timeout)
+        logger.debug("Got attribute '%s' from element %s: %s", attribute, locator, value)
         return value
     
     def clear_field(self, locator: Tuple[By, str], timeout: int = None):
         """Clear input field"""
-        element = self.find_element(locator, timeout)
-        logger.info(f"Clearing field: {locator}")
-        element.clear()
+        logger.info("Clearing field: %s", locator)
+        self._with_element(locator, lambda element: element.clear(), timeout)
     
     # Advanced Interaction Methods
     
@@ -230,19 +517,19 @@ class BasePage:
             timeout: Custom timeout in seconds
         """
         element = self.find_element(locator, timeout)
-        logger.info(f"Hovering over element: {locator}")
+        logger.info("Hovering over element: %s", locator)
         self.actions.move_to_element(element).perform()
     
     def double_click_element(self, locator: Tuple[By, str], timeout: int = None):
         """Double click on element"""
         element = self.find_element(locator, timeout)
-        logger.info(f"Double clicking element: {locator}")
+        logger.info("Double clicking element: %s", locator)
         self.actions.double_click(element).perform()
     
     def right_click_element(self, locator: Tuple[By, str], timeout: int = None):
         """Right click on element"""
         element = self.find_element(locator, timeout)
-        logger.info(f"Right clicking element: {locator}")
+        logger.info("Right clicking element: %s", locator)
         self.actions.context_click(element).perform()
     
     def drag_and_drop(self, source_locator: Tuple[By, str], target_locator: Tuple[By, str], timeout: int = None):
@@ -254,9 +541,10 @@ class BasePage:
             target_locator: Target element locator
             timeout: Custom timeout in seconds
         """
-        source = self.find_element(source_locator, timeout)
-        target = self.find_element(target_locator, timeout)
-        logger.info(f"Dragging {source_locator} to {target_locator}")
+        wait = self._wait(timeout)
+        source = wait.until(EC.presence_of_element_located(source_locator))
+        target = wait.until(EC.presence_of_element_located(target_locator))
+        logger.info("Dragging %s to %s", source_locator, target_locator)
         self.actions.drag_and_drop(source, target).perform()
     
     def press_key(self, locator: Tuple[By, str], key: str, timeout: int = None):
@@ -268,36 +556,49 @@ class BasePage:
             key: Key to press (use Keys class)
             timeout: Custom timeout in seconds
         """
-        element = self.find_element(locator, timeout)
-        logger.info(f"Pressing key {key} on element: {locator}")
-        element.send_keys(key)
+        logger.info("Pressing key %s on element: %s", key, locator)
+        self._with_element(locator, lambda element: element.send_keys(key), timeout)
     
     # Wait Methods
     
     def wait_for_element_visible(self, locator: Tuple[By, str], timeout: int = None):
         """Wait until element is visible"""
-        timeout = timeout or config.timeout
-        logger.info(f"Waiting for element to be visible: {locator}")
-        return WebDriverWait(self.driver, timeout).until(
+        logger.info("Waiting for element to be visible: %s", locator)
+        return self._wait(timeout).until(
             EC.visibility_of_element_located(locator)
         )
     
     def wait_for_element_invisible(self, locator: Tuple[By, str], timeout: int = None):
         """Wait until element is invisible"""
-        timeout = timeout or config.timeout
-        logger.info(f"Waiting for element to be invisible: {locator}")
-        return WebDriverWait(self.driver, timeout).until(
+        logger.info("Waiting for element to be invisible: %s", locator)
+        return self._wait(timeout).until(
             EC.invisibility_of_element_located(locator)
         )
     
     def wait_for_text_in_element(self, locator: Tuple[By, str], text: str, timeout: int = None):
         """Wait until specific text appears in element"""
-        timeout = timeout or config.timeout
-        logger.info(f"Waiting for text '{text}' in element: {locator}")
-        return WebDriverWait(self.driver, timeout).until(
+        logger.info("Waiting for text '%s' in element: %s", text, locator)
+        return self._wait(timeout).until(
             EC.text_to_be_present_in_element(locator, text)
         )
     
+    def wait_for_url_contains(self, fragment: str, timeout: int = None) -> bool:
+        """
+        Wait until the current URL contains a fragment
+        
+        Args:
+            fragment: Expected URL substring (e.g. "cart.html")
+            timeout: Custom timeout in seconds (defaults to config timeout)
+        
+        Returns:
+            True if the URL matched in time
+        """
+        try:
+            return self._wait(timeout).until(EC.url_contains(fragment))
+        except TimeoutException:
+            logger.error("URL did not contain '%s': %s", fragment, self.driver.current_url)
+            return False
+    
     # JavaScript Execution Methods
     
     def execute_script(self, script: str, *args):
@@ -311,75 +612,140 @@ class BasePage:
         Returns:
             Script execution result
         """
-        logger.debug(f"Executing script: {script}")
+        logger.debug("Executing script: %s", script)
         return self.driver.execute_script(script, *args)
     
     def scroll_to_element(self, locator: Tuple[By, str], timeout: int = None):
         """Scroll to element using JavaScript"""
         element = self.find_element(locator, timeout)
-        logger.info(f"Scrolling to element: {locator}")
-        self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
+        logger.info("Scrolling to element: %s", locator)
+        self.driver.execute_script(_SCROLL_INTO_VIEW_JS, element)
     
     def scroll_to_bottom(self):
         """Scroll to bottom of page"""
         logger.info("Scrolling to bottom of page")
-        self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        self.driver.execute_script(_SCROLL_BOTTOM_JS)
     
     def scroll_to_top(self):
         """Scroll to top of page"""
         logger.info("Scrolling to top of page")
-        self.driver.execute_script("window.scrollTo(0, 0);")
+        self.driver.execute_script(_SCROLL_TOP_JS)
     
     def click_with_js(self, locator: Tuple[By, str], timeout: int = None):
         """Click element using JavaScript (useful when normal click fails)"""
         element = self.find_element(locator, timeout)
-        logger.info(f"Clicking element with JavaScript: {locator}")
-        self.driver.execute_script("arguments[0].click();", element)
+        logger.info("Clicking element with JavaScript: %s", locator)
+        self.driver.execute_script(_JS_CLICK_JS, element)
+    
+    def snapshot(self, js_expression: str):
+        """
+        Evaluate a read-only JavaScript expression in one call
+        
+        Lets a page read several facts at once, e.g.
+        "{url: location.href, logo: !!document.querySelector('.app_logo')}"
+        
+        Args:
+            js_expression: JavaScript expression (object literal, array, value)
+        
+        Returns:
+            Expression value converted by WebDriver (dict, list, str, ...)
+        """
+        return self.driver.execute_script(f"return ({js_expression});")
+    
+    def js_click_all(self, css_selector: str, limit: int = None) -> int:
+        """
+        Click every matching element (or the first limit) with one script call
+        
+        Args:
+            css_selector: CSS selector
+            limit: Maximum number of elements to click, in document order
+        
+        Returns:
+            Number of elements clicked
+        """
+        clicked = self.driver.execute_script(_CLICK_ALL_JS, css_selector, limit)
+        logger.info("Clicked %d elements with JavaScript: %s", clicked, css_selector)
+        return clicked
+    
+    def js_click_all_and_count(self, css_selector: str, limit: int = None) -> Tuple[int, int]:
+        """
+        Click like js_click_all and read the cart badge in the same script call
+        
+        Args:
+            css_selector: CSS selector
+            limit: Maximum number of elements to click, in document order
+        
+        Returns:
+            Tuple of (elements clicked, cart badge count after clicking)
+        """
+        clicked, cart_count = self.driver.execute_script(_CLICK_ALL_JS, css_selector, limit, True)
+        logger.info("Clicked %d elements with JavaScript: %s (cart: %d)", clicked, css_selector, cart_count)
+        return clicked, cart_count
+    
+    def scroll_and_click_with_js(self, locator: Tuple[By, str], timeout: int = None):
+        """Scroll element into view and click it using JavaScript in a single call"""
+        element = self.find_element(locator, timeout)
+        logger.info("Scrolling to and clicking element with JavaScript: %s", locator)
+        self.driver.execute_script(_SCROLL_AND_CLICK_JS, element)
     
     # Frame/Window Handling
     
     def switch_to_frame(self, frame_locator: Tuple[By, str], timeout: int = None):
         """Switch to iframe"""
-        timeout = timeout or config.timeout
-        logger.info(f"Switching to frame: {frame_locator}")
-        WebDriverWait(self.driver, timeout).until(
+        logger.info("Switching to frame: %s", frame_locator)
+        self._invalidate_caches()
+        self._wait(timeout).until(
             EC.frame_to_be_available_and_switch_to_it(frame_locator)
         )
     
     def switch_to_default_content(self):
         """Switch back to main content from iframe"""
         logger.info("Switching to default content")
+        self._invalidate_caches()
         self.driver.switch_to.default_content()
     
     def switch_to_window(self, window_handle: str):
         """Switch to specific window"""
-        logger.info(f"Switching to window: {window_handle}")
+        logger.info("Switching to window: %s", window_handle)
+        self._invalidate_caches()
         self.driver.switch_to.window(window_handle)
     
     def get_window_handles(self) -> List[str]:
         """Get all window handles"""
         return self.driver.window_handles
     
+    def wait_for_new_window(self, previous_count: int, timeout: int = None) -> str:
+        """
+        Wait until a new window opens
+        
+        Args:
+            previous_count: Number of window handles before the window was opened
+            timeout: Custom timeout in seconds
+        
+        Returns:
+            Handle of the newly opened window
+        """
+        logger.info("Waiting for window %d to open", previous_count + 1)
+        self._wait(timeout).until(EC.number_of_windows_to_be(previous_count + 1))
+        return self.driver.window_handles[-1]
+    
     # Alert Handling
     
     def accept_alert(self, timeout: int = None):
         """Accept JavaScript alert"""
-        timeout = timeout or config.timeout
         logger.info("Accepting alert")
-        WebDriverWait(self.driver, timeout).until(EC.alert_is_present())
+        self._wait(timeout).until(EC.alert_is_present())
         self.driver.switch_to.alert.accept()
     
     def dismiss_alert(self, timeout: int = None):
         """Dismiss JavaScript alert"""
-        timeout = timeout or config.timeout
         logger.info("Dismissing alert")
-        WebDriverWait(self.driver, timeout).until(EC.alert_is_present())
+        self._wait(timeout).until(EC.alert_is_present())
         self.driver.switch_to.alert.dismiss()
     
     def get_alert_text(self, timeout: int = None) -> str:
         """Get alert text"""
-        timeout = timeout or config.timeout
-        WebDriverWait(self.driver, timeout).until(EC.alert_is_present())
+        self._wait(timeout).until(EC.alert_is_present())
         alert_text = self.driver.switch_to.alert.text
-        logger.info(f"Alert text: {alert_text}")
+        logger.info("Alert text: %s", alert_text)
         return alert_text
\ No newline at end of file
@@ -3,6 +3,10 @@ Browser Factory
 Handles WebDriver initialization for different browsers with various configurations
 """
 
+import copy
+import shutil
+import tempfile
+from urllib.parse import urlparse
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
@@ -10,80 +14,227 @@ from selenium.webdriver.edge.service import Service as EdgeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.webdriver.common.driver_finder import DriverFinder
+from selenium.webdriver.remote.remote_connection import RemoteConnection
 from config.config import config
 from utils.logger import logger
 
 
+# Clears web storage for the current origin when a driver is reused between tests
+_CLEAR_STORAGE_JS = "window.localStorage.clear(); window.sessionStorage.clear();"
+
+
+class _PooledRemoteConnection(RemoteConnection):
+    """RemoteConnection whose urllib3 pool lets concurrent commands (e.g. screenshots) share connections"""
+    
+    # Extra PoolManager arguments; urllib3 keeps a single connection per host by default.
+    # Connections are kept alive (keep_alive=True) so commands skip TCP/TLS setup.
+    pool_manager_args = {'maxsize': 10, 'block': False}
+    
+    def _get_connection_manager(self):
+        manager = super()._get_connection_manager()
+        manager.connection_pool_kw.update(self.pool_manager_args)
+        return manager
+
+
 class BrowserFactory:
     """Factory class to create WebDriver instances"""
     
+    # Options templates keyed by (browser, headless), built from environments.json
+    _options_cache = {}
+    
+    # Resolved driver binary paths keyed by browser
+    _driver_paths = {}
+    
+    # Per-worker browser profile directories keyed by session id, removed on quit
+    _profile_dirs = {}
+    
     @staticmethod
-    def get_driver(browser: str = None, headless: bool = None):
+    def get_driver(browser: str = None, headless: bool = None, remote_url: str = None):
         """
         Create and return a WebDriver instance
         
         Args:
             browser: Browser name (chrome, firefox, edge, safari)
             headless: Run browser in headless mode
+            remote_url: Selenium Grid URL (defaults to REMOTE_URL; local browser when unset)
         
         Returns:
             WebDriver instance
         """
         browser = browser or config.browser
         headless = headless if headless is not None else config.headless
+        remote_url = remote_url or config.remote_url
+        
+        logger.info("Initializing %s browser (headless: %s)", browser, headless)
+        
+        if remote_url:
+            if browser not in _OPTION_CLASSES:
+                raise ValueError(f"Unsupported remote browser: {browser}")
+            return BrowserFactory._get_remote_driver(browser, headless, remote_url)
+        
+        try:
+            factory = _FACTORIES[browser]
+        except KeyError:
+            raise ValueError(f"Unsupported browser: {browser}") from None
+        return factory(headless)
+    
+    @staticmethod
+    def prewarm(browser: str = None, headless: bool = None, remote_url: str = None):
+        """
+        Build the options template and resolve the driver binary ahead of the first test
+        
+        Args:
+            browser: Browser name (chrome, firefox, edge, safari)
+            headless: Run browser in headless mode
+            remote_url: Selenium Grid URL (no local driver binary is needed when set)
+        """
+        browser = browser or config.browser
+        headless = headless if headless is not None else config.headless
+        remote_url = remote_url or config.remote_url
+        
+        if browser not in _OPTION_CLASSES:
+            return
+        
+        options = BrowserFactory._get_options(browser, headless)
+        if not remote_url:
+            BrowserFactory._get_service(browser, _SERVICE_CLASSES[browser], options)
+        logger.info("Prewarmed %s driver setup", browser)
+    
+    @staticmethod
+    def _get_options(browser: str, headless: bool):
+        """
+        Get Options for browser, building the template only once per (browser, headless)
+        
+        Args:
+            browser: Browser name (chrome, firefox, edge)
+            headless: Run browser in headless mode
+        
+        Returns:
+            Copy of the cached browser Options template
+        """
+        key = (browser, headless)
+        template = BrowserFactory._options_cache.get(key)
+        if template is None:
+            template = BrowserFactory._apply_options(
+                _OPTION_CLASSES[browser],
+                config.get_browser_options(browser),
+                headless
+            )
+            BrowserFactory._options_cache[key] = template
+        return copy.deepcopy(template)
+    
+    @staticmethod
+    def _apply_options(options_cls, spec: dict, headless: bool):
+        """
+        Build an Options instance from a browser options spec
+        
+        Args:
+            options_cls: Selenium Options class for the browser
+            spec: Options spec (args, headless_args, experimental, preferences, page_load_strategy;
+                blocked_urls is applied after launch by _block_urls)
+            headless: Run browser in headless mode
         
-        logger.info(f"Initializing {browser} browser (headless: {headless})")
+        Returns:
+            Browser Options instance
+        """
+        options = options_cls()
+        
+        for argument in spec.get('args', []):
+            options.add_argument(argument)
+        
+        if headless:
+            for argument in spec.get('headless_args', []):
+                options.add_argument(argument)
+        
+        for name, value in spec.get('experimental', {}).items():
+            options.add_experimental_option(name, value)
+        
+        for name, value in spec.get('preferences', {}).items():
+            options.set_preference(name, value)
         
-        if browser == 'chrome':
-            return BrowserFactory._get_chrome_driver(headless)
-        elif browser == 'firefox':
-            return BrowserFactory._get_firefox_driver(headless)
-        elif browser == 'edge':
-            return BrowserFactory._get_edge_driver(headless)
-        elif browser == 'safari':
-            return BrowserFactory._get_safari_driver()
-        else:
-            raise ValueError(f"Unsupported browser: {browser}")
+        if 'page_load_strategy' in spec:
+            options.page_load_strategy = spec['page_load_strategy']
+        
+        return options
+    
+    @staticmethod
+    def _get_service(browser: str, service_cls, options):
+        """
+        Create a driver Service, resolving the driver binary only once per browser
+        
+        Args:
+            browser: Browser name (chrome, firefox, edge)
+            service_cls: Selenium Service class for the browser
+            options: Browser Options used to locate a matching driver
+        
+        Returns:
+            Service instance with an explicit executable path
+        """
+        path = BrowserFactory._driver_paths.get(browser)
+        if path is None:
+            path = DriverFinder.get_path(service_cls(), options)
+            BrowserFactory._driver_paths[browser] = path
+            logger.debug("Resolved %s driver binary: %s", browser, path)
+        return service_cls(executable_path=path)
+    
+    @staticmethod
+    def _isolate_profile(browser: str, options):
+        """
+        Point a Chromium browser at its own user-data-dir when running in an xdist worker
+        
+        The directory is prefixed with the worker id so parallel workers (and
+        several drivers in one worker) never share a profile.
+        
+        Args:
+            browser: Browser name (chrome, edge)
+            options: Browser Options to add the argument to
+        
+        Returns:
+            Profile directory path, or None outside a worker process
+        """
+        worker_id = config.worker_id
+        if not worker_id:
+            return None
+        profile_dir = tempfile.mkdtemp(prefix=f"{browser}-{worker_id}-")
+        options.add_argument(f"--user-data-dir={profile_dir}")
+        return profile_dir
+    
+    @staticmethod
+    def _track_profile(driver, profile_dir: str):
+        """Remember a driver's profile directory so quit_driver can remove it"""
+        if profile_dir:
+            BrowserFactory._profile_dirs[driver.session_id] = profile_dir
+    
+    @staticmethod
+    def _block_urls(browser: str, driver):
+        """
+        Block the browser's configured blocked_urls patterns (e.g. images, fonts) via CDP
+        
+        Args:
+            browser: Browser name (chrome, edge)
+            driver: Chromium WebDriver instance
+        """
+        patterns = config.get_browser_options(browser).get('blocked_urls')
+        if not patterns:
+            return
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        except Exception as e:
+            logger.warning("Failed to block URLs for %s: %s", browser, e)
     
     @staticmethod
     def _get_chrome_driver(headless: bool):
         """Create Chrome WebDriver with options"""
-        options = ChromeOptions()
-        
-        # Performance optimizations
-        options.add_argument('--disable-gpu')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-extensions')
-        options.add_argument('--disable-infobars')
-        options.add_argument('--start-maximized')
-        
-        # Privacy and security
-        options.add_argument('--incognito')
-        options.add_experimental_option('excludeSwitches', ['enable-logging'])
-        options.add_experimental_option('useAutomationExtension', False)
-        
-        # Disable automation flags
-        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        options.add_experimental_option('useAutomationExtension', False)
-        
-        # Headless mode
-        if headless:
-            options.add_argument('--headless=new')
-            options.add_argument('--window-size=1920,1080')
-        
-        # Additional preferences
-        prefs = {
-            'download.default_directory': '/tmp',
-            'download.prompt_for_download': False,
-            'profile.default_content_setting_values.notifications': 2,
-            'profile.default_content_settings.popups': 0
-        }
-        options.add_experimental_option('prefs', prefs)
-        
-        driver = webdriver.Chrome(options=options)
-        driver.maximize_window()
-        driver.implicitly_wait(config.timeout)
+        options = BrowserFactory._get_options('chrome', headless)
+        service = BrowserFactory._get_service('chrome', _SERVICE_CLASSES['chrome'], options)
+        profile_dir = BrowserFactory._isolate_profile('chrome', options)
+        # Window size is set via options, no maximize round trip needed
+        driver = webdriver.Chrome(service=service, options=options)
+        driver.implicitly_wait(0)  # Explicit waits only, avoid compounding timeouts
+        BrowserFactory._track_profile(driver, profile_dir)
+        BrowserFactory._block_urls('chrome', driver)
         
         logger.info("Chrome driver initialized successfully")
         return driver
@@ -91,23 +242,11 @@ class BrowserFactory:
     @staticmethod
     def _get_firefox_driver(headless: bool):
         """Create Firefox WebDriver with options"""
-        options = FirefoxOptions()
-        
-        # Performance optimizations
-        options.add_argument('--width=1920')
-        options.add_argument('--height=1080')
-        
-        # Privacy
-        options.set_preference('browser.privatebrowsing.autostart', True)
-        options.set_preference('dom.webnotifications.enabled', False)
-        
-        # Headless mode
-        if headless:
-            options.add_argument('--headless')
-        
-        driver = webdriver.Firefox(options=options)
-        driver.maximize_window()
-        driver.implicitly_wait(config.timeout)
+        options = BrowserFactory._get_options('firefox', headless)
+        service = BrowserFactory._get_service('firefox', _SERVICE_CLASSES['firefox'], options)
+        # Window size is set via options, no maximize round trip needed
+        driver = webdriver.Firefox(service=service, options=options)
+        driver.implicitly_wait(0)  # Explicit waits only, avoid compounding timeouts
         
         logger.info("Firefox driver initialized successfully")
         return driver
@@ -115,45 +254,98 @@ class BrowserFactory:
     @staticmethod
     def _get_edge_driver(headless: bool):
         """Create Edge WebDriver with options"""
-        options = EdgeOptions()
-        
-        # Performance optimizations
-        options.add_argument('--disable-gpu')
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--start-maximized')
-        
-        # Privacy
-        options.add_argument('--inprivate')
-        
-        # Headless mode
-        if headless:
-            options.add_argument('--headless')
-            options.add_argument('--window-size=1920,1080')
-        
-        driver = webdriver.Edge(options=options)
-        driver.maximize_window()
-        driver.implicitly_wait(config.timeout)
+        options = BrowserFactory._get_options('edge', headless)
+        service = BrowserFactory._get_service('edge', _SERVICE_CLASSES['edge'], options)
+        profile_dir = BrowserFactory._isolate_profile('edge', options)
+        # Window size is set via options, no maximize round trip needed
+        driver = webdriver.Edge(service=service, options=options)
+        driver.implicitly_wait(0)  # Explicit waits only, avoid compounding timeouts
+        BrowserFactory._track_profile(driver, profile_dir)
+        BrowserFactory._block_urls('edge', driver)
         
         logger.info("Edge driver initialized successfully")
         return driver
     
+    @staticmethod
+    def _get_remote_driver(browser: str, headless: bool, remote_url: str):
+        """Create Remote WebDriver on a Selenium Grid with pooled connections"""
+        options = BrowserFactory._get_options(browser, headless)
+        executor = _PooledRemoteConnection(remote_url, keep_alive=True)
+        driver = webdriver.Remote(command_executor=executor, options=options)
+        driver.implicitly_wait(0)  # Explicit waits only, avoid compounding timeouts
+        
+        logger.info("Remote %s driver initialized successfully: %s", browser, remote_url)
+        return driver
+    
     @staticmethod
     def _get_safari_driver():
         """Create Safari WebDriver"""
         driver = webdriver.Safari()
         driver.maximize_window()
-        driver.implicitly_wait(config.timeout)
+        driver.implicitly_wait(0)  # Explicit waits only, avoid compounding timeouts
         
         logger.info("Safari driver initialized successfully")
         return driver
     
+    @staticmethod
+    def reset_driver(driver) -> bool:
+        """
+        Clear cookies and web storage so a reused driver starts the next test logged out
+        
+        Chromium drivers clear cookies for every origin through CDP; other
+        browsers can only delete the current domain's cookies. Web storage is
+        only reachable on http(s) pages, so it is skipped on about:blank or data: URLs.
+        
+        Args:
+            driver: WebDriver instance
+        
+        Returns:
+            True if the state was reset
+        """
+        try:
+            if hasattr(driver, "execute_cdp_cmd"):
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            else:
+                driver.delete_all_cookies()
+            if urlparse(driver.current_url).scheme in ("http", "https"):
+                driver.execute_script(_CLEAR_STORAGE_JS)
+            return True
+        except Exception as e:
+            logger.warning("Failed to reset browser state: %s", e)
+            return False
+    
     @staticmethod
     def quit_driver(driver):
         """Safely quit the WebDriver"""
         if driver:
+            profile_dir = BrowserFactory._profile_dirs.pop(driver.session_id, None)
             try:
                 driver.quit()
                 logger.info("WebDriver closed successfully")
             except Exception as e:
-                logger.error(f"Error closing WebDriver: {str(e)}")
\ No newline at end of file
+                logger.error("Error closing WebDriver: %s", e)
+            if profile_dir:
+                shutil.rmtree(profile_dir, ignore_errors=True)
+
+
+# Browser name -> driver factory (each accepts the headless flag)
+_FACTORIES = {
+    'chrome': BrowserFactory._get_chrome_driver,
+    'firefox': BrowserFactory._get_firefox_driver,
+    'edge': BrowserFactory._get_edge_driver,
+    'safari': lambda headless: BrowserFactory._get_safari_driver(),
+}
+
+# Browser name -> Service class
+_SERVICE_CLASSES = {
+    'chrome': ChromeService,
+    'firefox': FirefoxService,
+    'edge': EdgeService,
+}
+
+# Browser name -> Options class
+_OPTION_CLASSES = {
+    'chrome': ChromeOptions,
+    'firefox': FirefoxOptions,
+    'edge': EdgeOptions,
+}
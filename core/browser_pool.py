@@ -0,0 +1,106 @@
+"""
+Browser Pool
+Process-local pool of WebDriver instances reused across tests (one pool per xdist worker)
+"""
+
+import queue
+import threading
+from core.browser_factory import BrowserFactory
+from utils.logger import logger
+
+
+class BrowserPool:
+    """Pool of idle drivers keyed by (browser, headless), capped per process"""
+    
+    _max_size = 0
+    _idle = {}
+    _created = 0
+    _lock = threading.Lock()
+    
+    @classmethod
+    def configure(cls, max_size: int):
+        """
+        Set the maximum number of drivers this process may launch
+        
+        Args:
+            max_size: Pool size (0 disables pooling)
+        """
+        cls._max_size = max_size
+    
+    @classmethod
+    def enabled(cls) -> bool:
+        """Check if pooling is enabled"""
+        return cls._max_size > 0
+    
+    @classmethod
+    def acquire(cls, browser: str, headless: bool):
+        """
+        Check out a driver, launching one while the pool is below its cap
+        
+        Blocks until a driver is released once the cap is reached.
+        
+        Args:
+            browser: Browser name (chrome, firefox, edge, safari)
+            headless: Run browser in headless mode
+        
+        Returns:
+            WebDriver instance
+        """
+        with cls._lock:
+            idle = cls._idle.setdefault((browser, headless), queue.Queue())
+            try:
+                return idle.get_nowait()
+            except queue.Empty:
+                launch = cls._created < cls._max_size
+                if launch:
+                    cls._created += 1
+        
+        if not launch:
+            return idle.get()
+        
+        try:
+            logger.info("Launching pooled %s driver", browser)
+            return BrowserFactory.get_driver(browser, headless)
+        except Exception:
+            with cls._lock:
+                cls._created -= 1
+            raise
+    
+    @classmethod
+    def release(cls, driver, browser: str, headless: bool):
+        """
+        Reset a driver and return it to the pool, quitting it if the reset fails
+        
+        Args:
+            driver: WebDriver instance from acquire
+            browser: Browser name used to acquire it
+            headless: Headless flag used to acquire it
+        """
+        if BrowserFactory.reset_driver(driver):
+            try:
+                driver.get("about:blank")
+                cls._idle[(browser, headless)].put(driver)
+                return
+            except Exception as e:
+                logger.warning("Discarding pooled driver: %s", e)
+        
+        BrowserFactory.quit_driver(driver)
+        with cls._lock:
+            cls._created -= 1
+    
+    @classmethod
+    def drain(cls):
+        """Quit every idle driver, typically at session end"""
+        with cls._lock:
+            idle_queues = list(cls._idle.values())
+            cls._idle = {}
+        
+        for idle in idle_queues:
+            while True:
+                try:
+                    driver = idle.get_nowait()
+                except queue.Empty:
+                    break
+                BrowserFactory.quit_driver(driver)
+                with cls._lock:
+                    cls._created -= 1
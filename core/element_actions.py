@@ -4,19 +4,109 @@ Custom element interaction methods with enhanced reliability and error handling
 """
 
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.webdriver.support.ui import Select
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
     StaleElementReferenceException,
     ElementClickInterceptedException,
     ElementNotInteractableException
 )
 from typing import List, Tuple
+from core.js_snippets import SET_NATIVE_VALUE_JS
 from utils.logger import logger
+import asyncio
+import platform
 import time
 
 
+# Short polling used while waiting for hover menus and scrolls to settle
+_SETTLE_TIMEOUT = 2
+_SETTLE_POLL = 0.05
+
+# Select-all then delete in one keystroke sequence (NULL releases the modifier)
+_SELECT_ALL_KEY = Keys.COMMAND if platform.system() == 'Darwin' else Keys.CONTROL
+_CLEAR_CHORD = _SELECT_ALL_KEY + "a" + Keys.NULL + Keys.BACK_SPACE
+
+# Read dropdown state in one script call instead of one request per option
+_OPTION_TEXTS_JS = "return Array.from(arguments[0].options).map(o => o.text);"
+_SELECTED_OPTION_TEXT_JS = (
+    "const s = arguments[0];"
+    "return s.selectedIndex < 0 ? null : s.options[s.selectedIndex].text;"
+)
+
+# Click fallbacks; the intercept path scrolls the target clear of overlays first
+_JS_CLICK_JS = "arguments[0].click();"
+_CENTER_AND_CLICK_JS = (
+    "arguments[0].scrollIntoView({block: 'center', inline: 'center'});"
+    "arguments[0].click();"
+)
+
+# Clear a field in one call through the native setter, returning the length of the removed value
+_CLEAR_VALUE_JS = SET_NATIVE_VALUE_JS + (
+    "const e = arguments[0]; const v = e.value || '';"
+    "setNativeValue(e, '');"
+    "return v.length;"
+)
+
+# Set many field values in one call through the native setter, firing the events frameworks listen for
+_BULK_FILL_JS = SET_NATIVE_VALUE_JS + "for (const [el, val] of arguments[0]) setNativeValue(el, val);"
+
+# Equivalent of Select.select_by_* in one call; selects the first match unless multiple
+_SELECT_OPTION_JS = (
+    "const [s, by, key] = arguments;"
+    "const matches = Array.from(s.options).filter(o =>"
+    " by === 'index' ? o.index === key : (by === 'value' ? o.value : o.text) === key);"
+    "if (!matches.length) return 'missing';"
+    "if (matches.some(o => o.disabled)) return 'disabled';"
+    "for (const o of (s.multiple ? matches : matches.slice(0, 1))) o.selected = true;"
+    "s.dispatchEvent(new Event('input', {bubbles: true}));"
+    "s.dispatchEvent(new Event('change', {bubbles: true}));"
+    "return 'ok';"
+)
+
+# Displayed-and-enabled check evaluated in the browser in one call
+_IS_CLICKABLE_JS = (
+    "const e = arguments[0]; const r = e.getBoundingClientRect();"
+    "return !e.disabled && r.width > 0 && r.height > 0"
+    " && window.getComputedStyle(e).visibility !== 'hidden';"
+)
+
+# Highlight, wait and restore the original style inside the browser
+_HIGHLIGHT_JS = (
+    "const [e, style, ms, done] = arguments;"
+    "const original = e.getAttribute('style');"
+    "e.setAttribute('style', style);"
+    "setTimeout(() => {"
+    " if (original === null) { e.removeAttribute('style'); }"
+    " else { e.setAttribute('style', original); }"
+    " done(); }, ms);"
+)
+
+
+def _backoff(attempt: int, base: float = 0.05, cap: float = 0.5) -> float:
+    """
+    Exponential backoff delay for retry loops
+    
+    Args:
+        attempt: Zero-based attempt number
+        base: Delay for the first retry in seconds
+        cap: Maximum delay in seconds
+    
+    Returns:
+        Delay in seconds (50ms, 100ms, 200ms, ... up to cap)
+    """
+    return min(cap, base * (2 ** attempt))
+
+
+async def _run_blocking(func, *args):
+    """Run a blocking WebDriver call in the default executor so the event loop stays free"""
+    return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+
 class ElementActions:
     """Enhanced element interaction methods"""
     
@@ -28,44 +118,88 @@ class ElementActions:
             driver: Selenium WebDriver instance
         """
         self.driver = driver
+        # One chain per instance; perform() drains it, _reset_actions() clears it after failures
         self.actions = ActionChains(driver)
     
-    def safe_click(self, element: WebElement, retry_count: int = 3) -> bool:
+    def _reset_actions(self) -> None:
+        """Clear queued and remotely held actions so a failed gesture can't leak into the next"""
+        try:
+            self.actions.reset_actions()
+        except Exception as e:
+            logger.debug("Failed to reset actions: %s", e)
+    
+    def _select_option(self, element: WebElement, by: str, key) -> None:
+        """
+        Select matching dropdown option(s) with one script call, skipping Select's tag check
+        
+        Args:
+            element: Select element
+            by: Match mode ('text', 'value' or 'index')
+            key: Visible text, value attribute or option index
+        
+        Raises:
+            NoSuchElementException: If no option matches, as Select does
+            NotImplementedError: If a matching option is disabled, as Select does
+        """
+        status = self.driver.execute_script(_SELECT_OPTION_JS, element, by, key)
+        if status == 'missing':
+            raise NoSuchElementException(f"Cannot locate option with {by}: {key}")
+        if status == 'disabled':
+            raise NotImplementedError("You may not select a disabled option")
+    
+    def safe_click(self, element: WebElement, retry_count: int = 3,
+                   prefer_js_on_intercept: bool = False) -> bool:
         """
         Click element with retry mechanism for reliability
         
+        Retries back off exponentially, so total wait is bounded by the
+        geometric sum of _backoff delays rather than a fixed pause per attempt
+        
         Args:
             element: WebElement to click
             retry_count: Number of retry attempts
+            prefer_js_on_intercept: On the first intercepted click, skip the remaining
+                native attempts and scroll + click with JavaScript (for pages with overlays)
         
         Returns:
             True if click successful, False otherwise
         """
+        if retry_count < 1:
+            return False
+        
+        script = _JS_CLICK_JS
         for attempt in range(retry_count):
             try:
                 element.click()
-                logger.debug(f"Click successful on attempt {attempt + 1}")
+                logger.debug("Click successful on attempt %d", attempt + 1)
                 return True
             except (StaleElementReferenceException, ElementClickInterceptedException) as e:
-                logger.warning(f"Click attempt {attempt + 1} failed: {str(e)}")
-                if attempt == retry_count - 1:
-                    logger.error("All click attempts failed")
-                    # Try JavaScript click as last resort
-                    try:
-                        self.driver.execute_script("arguments[0].click();", element)
-                        logger.info("JavaScript click successful")
-                        return True
-                    except Exception as js_error:
-                        logger.error(f"JavaScript click failed: {str(js_error)}")
-                        return False
-                time.sleep(0.5)
-        return False
+                logger.warning("Click attempt %d failed: %s", attempt + 1, e)
+                if prefer_js_on_intercept and isinstance(e, ElementClickInterceptedException):
+                    logger.info("Click intercepted, switching to JavaScript click")
+                    script = _CENTER_AND_CLICK_JS
+                    break
+                if attempt < retry_count - 1:
+                    time.sleep(_backoff(attempt))
+        else:
+            logger.error("All click attempts failed")
+        
+        # Try JavaScript click as last resort
+        try:
+            self.driver.execute_script(script, element)
+            logger.info("JavaScript click successful")
+            return True
+        except Exception as js_error:
+            logger.error("JavaScript click failed: %s", js_error)
+            return False
     
     def safe_send_keys(self, element: WebElement, text: str, clear_first: bool = True, 
                        retry_count: int = 3) -> bool:
         """
         Send keys to element with retry mechanism
         
+        Retries back off exponentially, see _backoff
+        
         Args:
             element: WebElement to type into
             text: Text to send
@@ -80,16 +214,39 @@ class ElementActions:
                 if clear_first:
                     element.clear()
                 element.send_keys(text)
-                logger.debug(f"Send keys successful on attempt {attempt + 1}")
+                logger.debug("Send keys successful on attempt %d", attempt + 1)
                 return True
             except (StaleElementReferenceException, ElementNotInteractableException) as e:
-                logger.warning(f"Send keys attempt {attempt + 1} failed: {str(e)}")
+                logger.warning("Send keys attempt %d failed: %s", attempt + 1, e)
                 if attempt == retry_count - 1:
                     logger.error("All send keys attempts failed")
                     return False
-                time.sleep(0.5)
+                time.sleep(_backoff(attempt))
         return False
     
+    def bulk_fill(self, fields: List[Tuple[WebElement, str]]) -> bool:
+        """
+        Fill several fields with a single JavaScript call
+        
+        Opt-in fast path alongside safe_send_keys: values are assigned through the
+        native value setter (so React-controlled inputs see them) and input/change
+        events are dispatched, but no keystroke events are sent, so
+        fields relying on keydown/keypress handlers should use safe_send_keys.
+        
+        Args:
+            fields: List of (element, value) pairs
+        
+        Returns:
+            True if successful
+        """
+        try:
+            self.driver.execute_script(_BULK_FILL_JS, [list(field) for field in fields])
+            logger.debug("Bulk filled %d fields", len(fields))
+            return True
+        except Exception as e:
+            logger.error("Bulk fill failed: %s", e)
+            return False
+    
     def select_dropdown_by_text(self, element: WebElement, text: str) -> bool:
         """
         Select dropdown option by visible text
@@ -102,12 +259,11 @@ class ElementActions:
             True if successful
         """
         try:
-            select = Select(element)
-            select.select_by_visible_text(text)
-            logger.info(f"Selected dropdown option: {text}")
+            self._select_option(element, 'text', text)
+            logger.info("Selected dropdown option: %s", text)
             return True
         except Exception as e:
-            logger.error(f"Failed to select dropdown option: {str(e)}")
+            logger.error("Failed to select dropdown option: %s", e)
             return False
     
     def select_dropdown_by_value(self, element: WebElement, value: str) -> bool:
@@ -122,12 +278,11 @@ class ElementActions:
             True if successful
         """
         try:
-            select = Select(element)
-            select.select_by_value(value)
-            logger.info(f"Selected dropdown value: {value}")
+            self._select_option(element, 'value', value)
+            logger.info("Selected dropdown value: %s", value)
             return True
         except Exception as e:
-            logger.error(f"Failed to select dropdown value: {str(e)}")
+            logger.error("Failed to select dropdown value: %s", e)
             return False
     
     def select_dropdown_by_index(self, element: WebElement, index: int) -> bool:
@@ -142,12 +297,11 @@ class ElementActions:
             True if successful
         """
         try:
-            select = Select(element)
-            select.select_by_index(index)
-            logger.info(f"Selected dropdown index: {index}")
+            self._select_option(element, 'index', index)
+            logger.info("Selected dropdown index: %s", index)
             return True
         except Exception as e:
-            logger.error(f"Failed to select dropdown index: {str(e)}")
+            logger.error("Failed to select dropdown index: %s", e)
             return False
     
     def get_dropdown_options(self, element: WebElement) -> List[str]:
@@ -161,12 +315,11 @@ class ElementActions:
             List of option texts
         """
         try:
-            select = Select(element)
-            options = [option.text for option in select.options]
-            logger.debug(f"Found {len(options)} dropdown options")
+            options = self.driver.execute_script(_OPTION_TEXTS_JS, element)
+            logger.debug("Found %d dropdown options", len(options))
             return options
         except Exception as e:
-            logger.error(f"Failed to get dropdown options: {str(e)}")
+            logger.error("Failed to get dropdown options: %s", e)
             return []
     
     def get_selected_dropdown_option(self, element: WebElement) -> str:
@@ -180,12 +333,13 @@ class ElementActions:
             Selected option text
         """
         try:
-            select = Select(element)
-            selected = select.first_selected_option.text
-            logger.debug(f"Selected option: {selected}")
+            selected = self.driver.execute_script(_SELECTED_OPTION_TEXT_JS, element)
+            if selected is None:
+                raise NoSuchElementException("No options are selected")
+            logger.debug("Selected option: %s", selected)
             return selected
         except Exception as e:
-            logger.error(f"Failed to get selected option: {str(e)}")
+            logger.error("Failed to get selected option: %s", e)
             return ""
     
     def checkbox_select(self, element: WebElement) -> bool:
@@ -206,7 +360,7 @@ class ElementActions:
                 logger.debug("Checkbox already selected")
             return True
         except Exception as e:
-            logger.error(f"Failed to select checkbox: {str(e)}")
+            logger.error("Failed to select checkbox: %s", e)
             return False
     
     def checkbox_deselect(self, element: WebElement) -> bool:
@@ -227,7 +381,7 @@ class ElementActions:
                 logger.debug("Checkbox already deselected")
             return True
         except Exception as e:
-            logger.error(f"Failed to deselect checkbox: {str(e)}")
+            logger.error("Failed to deselect checkbox: %s", e)
             return False
     
     def radio_button_select(self, element: WebElement) -> bool:
@@ -246,7 +400,7 @@ class ElementActions:
                 logger.info("Radio button selected")
             return True
         except Exception as e:
-            logger.error(f"Failed to select radio button: {str(e)}")
+            logger.error("Failed to select radio button: %s", e)
             return False
     
     def hover_and_click(self, hover_element: WebElement, click_element: WebElement) -> bool:
@@ -262,12 +416,19 @@ class ElementActions:
         """
         try:
             self.actions.move_to_element(hover_element).perform()
-            time.sleep(0.5)  # Brief pause for menu to appear
+            # Poll for the menu item instead of a blind pause
+            try:
+                WebDriverWait(self.driver, _SETTLE_TIMEOUT, poll_frequency=_SETTLE_POLL).until(
+                    lambda d: click_element.is_displayed() and click_element.is_enabled()
+                )
+            except TimeoutException:
+                logger.debug("Hover target not ready after polling, clicking anyway")
             click_element.click()
             logger.info("Hover and click successful")
             return True
         except Exception as e:
-            logger.error(f"Hover and click failed: {str(e)}")
+            self._reset_actions()
+            logger.error("Hover and click failed: %s", e)
             return False
     
     def drag_and_drop_by_offset(self, element: WebElement, x_offset: int, y_offset: int) -> bool:
@@ -284,10 +445,11 @@ class ElementActions:
         """
         try:
             self.actions.drag_and_drop_by_offset(element, x_offset, y_offset).perform()
-            logger.info(f"Drag and drop by offset successful: ({x_offset}, {y_offset})")
+            logger.info("Drag and drop by offset successful: (%d, %d)", x_offset, y_offset)
             return True
         except Exception as e:
-            logger.error(f"Drag and drop by offset failed: {str(e)}")
+            self._reset_actions()
+            logger.error("Drag and drop by offset failed: %s", e)
             return False
     
     def send_special_key(self, element: WebElement, key: str) -> bool:
@@ -303,31 +465,44 @@ class ElementActions:
         """
         try:
             element.send_keys(key)
-            logger.info(f"Special key sent: {key}")
+            logger.info("Special key sent: %s", key)
             return True
         except Exception as e:
-            logger.error(f"Failed to send special key: {str(e)}")
+            logger.error("Failed to send special key: %s", e)
             return False
     
-    def clear_field_with_backspace(self, element: WebElement) -> bool:
+    def clear_field_with_backspace(self, element: WebElement, use_keystrokes: bool = False) -> bool:
         """
-        Clear field by sending backspace keys (useful when .clear() doesn't work)
+        Clear field when .clear() doesn't work
+        
+        By default the value is emptied with one script call that goes through the
+        native value setter (so React-controlled inputs update their state) and
+        fires input/change events. With use_keystrokes, a select-all + backspace chord
+        is sent instead (falling back to one batched string of backspaces if any
+        text remains) for inputs that need real key events, e.g. masked inputs.
         
         Args:
             element: Input element
+            use_keystrokes: Clear with backspace keystrokes instead of JavaScript
         
         Returns:
             True if successful
         """
         try:
+            if not use_keystrokes:
+                length = self.driver.execute_script(_CLEAR_VALUE_JS, element)
+                logger.info("Field cleared (%d characters removed)", length)
+                return True
             current_value = element.get_attribute("value")
             if current_value:
-                for _ in range(len(current_value)):
-                    element.send_keys(Keys.BACK_SPACE)
+                element.send_keys(_CLEAR_CHORD)
+                remaining = element.get_attribute("value")
+                if remaining:
+                    element.send_keys(Keys.BACK_SPACE * len(remaining))
             logger.info("Field cleared with backspace")
             return True
         except Exception as e:
-            logger.error(f"Failed to clear field with backspace: {str(e)}")
+            logger.error("Failed to clear field with backspace: %s", e)
             return False
     
     def scroll_element_into_center(self, element: WebElement) -> bool:
@@ -345,42 +520,53 @@ class ElementActions:
                 "arguments[0].scrollIntoView({block: 'center', inline: 'center'});",
                 element
             )
-            time.sleep(0.3)  # Brief pause for scroll
+            WebDriverWait(self.driver, _SETTLE_TIMEOUT, poll_frequency=_SETTLE_POLL).until(
+                EC.visibility_of(element)
+            )
             logger.info("Element scrolled into center")
             return True
         except Exception as e:
-            logger.error(f"Failed to scroll element into center: {str(e)}")
+            logger.error("Failed to scroll element into center: %s", e)
             return False
     
     def highlight_element(self, element: WebElement, duration: float = 2.0) -> None:
         """
         Highlight element temporarily (useful for debugging)
         
+        Runs as one async script, so the call blocks for duration in the browser.
+        The script timeout is raised only if needed and restored afterwards.
+        
         Args:
             element: Element to highlight
             duration: How long to highlight (seconds)
         """
         try:
-            original_style = element.get_attribute("style")
-            self.driver.execute_script(
-                "arguments[0].setAttribute('style', arguments[1]);",
-                element,
-                "border: 3px solid red; background-color: yellow;"
-            )
-            time.sleep(duration)
-            self.driver.execute_script(
-                "arguments[0].setAttribute('style', arguments[1]);",
-                element,
-                original_style
-            )
+            previous = self.driver.timeouts.script
+            needed = duration + 1
+            if needed > previous:
+                self.driver.set_script_timeout(needed)
+            try:
+                self.driver.execute_async_script(
+                    _HIGHLIGHT_JS,
+                    element,
+                    "border: 3px solid red; background-color: yellow;",
+                    int(duration * 1000)
+                )
+            finally:
+                if needed > previous:
+                    self.driver.set_script_timeout(previous)
             logger.debug("Element highlighted")
         except Exception as e:
-            logger.error(f"Failed to highlight element: {str(e)}")
+            logger.error("Failed to highlight element: %s", e)
     
     def is_element_clickable(self, element: WebElement) -> bool:
         """
         Check if element is clickable (displayed and enabled)
         
+        Uses a single script probe instead of separate is_displayed/is_enabled
+        calls. "Displayed" here means a non-empty box that is not visibility:hidden,
+        which is looser than Selenium's is_displayed atom.
+        
         Args:
             element: Element to check
         
@@ -388,6 +574,106 @@ class ElementActions:
             True if clickable
         """
         try:
-            return element.is_displayed() and element.is_enabled()
+            return bool(self.driver.execute_script(_IS_CLICKABLE_JS, element))
         except Exception:
-            return False
\ No newline at end of file
+            return False
+    
+    async def safe_click_async(self, element: WebElement, retry_count: int = 3,
+                               prefer_js_on_intercept: bool = False) -> bool:
+        """
+        Async variant of safe_click
+        
+        WebDriver calls run in the default executor and back-off uses asyncio.sleep,
+        so other tasks on the event loop progress while this one retries
+        
+        Args:
+            element: WebElement to click
+            retry_count: Number of retry attempts
+            prefer_js_on_intercept: Switch to a JavaScript click on the first intercepted click
+        
+        Returns:
+            True if click successful, False otherwise
+        """
+        if retry_count < 1:
+            return False
+        
+        script = _JS_CLICK_JS
+        for attempt in range(retry_count):
+            try:
+                await _run_blocking(element.click)
+                logger.debug("Click successful on attempt %d", attempt + 1)
+                return True
+            except (StaleElementReferenceException, ElementClickInterceptedException) as e:
+                logger.warning("Click attempt %d failed: %s", attempt + 1, e)
+                if prefer_js_on_intercept and isinstance(e, ElementClickInterceptedException):
+                    logger.info("Click intercepted, switching to JavaScript click")
+                    script = _CENTER_AND_CLICK_JS
+                    break
+                if attempt < retry_count - 1:
+                    await asyncio.sleep(_backoff(attempt))
+        else:
+            logger.error("All click attempts failed")
+        
+        try:
+            await _run_blocking(self.driver.execute_script, script, element)
+            logger.info("JavaScript click successful")
+            return True
+        except Exception as js_error:
+            logger.error("JavaScript click failed: %s", js_error)
+            return False
+    
+    async def safe_send_keys_async(self, element: WebElement, text: str, clear_first: bool = True,
+                                   retry_count: int = 3) -> bool:
+        """
+        Async variant of safe_send_keys
+        
+        Args:
+            element: WebElement to type into
+            text: Text to send
+            clear_first: Clear field before typing
+            retry_count: Number of retry attempts
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        for attempt in range(retry_count):
+            try:
+                if clear_first:
+                    await _run_blocking(element.clear)
+                await _run_blocking(element.send_keys, text)
+                logger.debug("Send keys successful on attempt %d", attempt + 1)
+                return True
+            except (StaleElementReferenceException, ElementNotInteractableException) as e:
+                logger.warning("Send keys attempt %d failed: %s", attempt + 1, e)
+                if attempt == retry_count - 1:
+                    logger.error("All send keys attempts failed")
+                    return False
+                await asyncio.sleep(_backoff(attempt))
+        return False
+    
+    async def hover_and_click_async(self, hover_element: WebElement, click_element: WebElement) -> bool:
+        """
+        Async variant of hover_and_click (the hover polling runs off the event loop)
+        
+        Args:
+            hover_element: Element to hover over
+            click_element: Element to click
+        
+        Returns:
+            True if successful
+        """
+        return await _run_blocking(self.hover_and_click, hover_element, click_element)
+    
+    async def clear_field_with_backspace_async(self, element: WebElement,
+                                               use_keystrokes: bool = False) -> bool:
+        """
+        Async variant of clear_field_with_backspace
+        
+        Args:
+            element: Input element
+            use_keystrokes: Clear with backspace keystrokes instead of JavaScript
+        
+        Returns:
+            True if successful
+        """
+        return await _run_blocking(self.clear_field_with_backspace, element, use_keystrokes)
@@ -0,0 +1,19 @@
+"""
+JavaScript Snippets
+Script fragments shared by the page objects and element helpers
+"""
+
+
+# Defines setNativeValue(el, value): assigns through the element prototype's native
+# value setter so React's value tracker sees the change, then fires input/change.
+# Prepend it to a script that calls setNativeValue.
+SET_NATIVE_VALUE_JS = (
+    "const setNativeValue = (el, value) => {"
+    " const proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype"
+    " : el instanceof HTMLSelectElement ? HTMLSelectElement.prototype"
+    " : HTMLInputElement.prototype;"
+    " Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);"
+    " el.dispatchEvent(new Event('input', {bubbles: true}));"
+    " el.dispatchEvent(new Event('change', {bubbles: true}));"
+    "};"
+)
@@ -3,13 +3,273 @@ Custom Wait Conditions
 Advanced wait conditions for complex scenarios
 """
 
+import re
+from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException
+)
 from typing import Tuple, Callable
 from utils.logger import logger
 
 
+# In-browser element counts, so polls return an int instead of every element reference
+_CSS_COUNT_JS = "return document.querySelectorAll(arguments[0]).length;"
+_XPATH_COUNT_JS = (
+    "return document.evaluate(arguments[0], document, null,"
+    " XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;"
+)
+_COUNT_SCRIPTS = {
+    By.CSS_SELECTOR: _CSS_COUNT_JS,
+    By.XPATH: _XPATH_COUNT_JS,
+}
+
+
+def _count_elements(driver, locator: Tuple) -> int:
+    """
+    Count elements matching locator
+    
+    CSS and XPath locators are counted with one script call; other strategies
+    fall back to find_elements.
+    
+    Args:
+        driver: WebDriver instance
+        locator: Tuple of (By, locator_value)
+    
+    Returns:
+        Number of matching elements
+    """
+    by, value = locator
+    script = _COUNT_SCRIPTS.get(by)
+    if script is None:
+        return len(driver.find_elements(by, value))
+    return driver.execute_script(script, value)
+
+
+class _ElementCondition:
+    """Wait predicate that reuses its element across polls, re-finding it only when stale"""
+    
+    __slots__ = ("locator", "_element")
+    
+    def __init__(self, locator: Tuple):
+        """
+        Args:
+            locator: Tuple of (By, locator_value)
+        """
+        self.locator = locator
+        self._element = None
+    
+    def _check(self, element) -> bool:
+        """Evaluate the condition against the located element"""
+        raise NotImplementedError
+    
+    def __call__(self, driver):
+        try:
+            if self._element is None:
+                self._element = driver.find_element(*self.locator)
+            return self._check(self._element)
+        except NoSuchElementException:
+            return False
+        except StaleElementReferenceException:
+            self._element = None
+            return False
+
+
+class _TextEquals(_ElementCondition):
+    """Element text equals expected text"""
+    
+    __slots__ = ("text",)
+    
+    def __init__(self, locator: Tuple, text: str):
+        super().__init__(locator)
+        self.text = text
+    
+    def _check(self, element) -> bool:
+        return element.text == self.text
+
+
+class _TextContains(_TextEquals):
+    """Element text contains substring"""
+    
+    __slots__ = ()
+    
+    def _check(self, element) -> bool:
+        return self.text in element.text
+
+
+class _AttrEquals(_ElementCondition):
+    """Element attribute equals value"""
+    
+    __slots__ = ("attribute", "value")
+    
+    def __init__(self, locator: Tuple, attribute: str, value: str):
+        super().__init__(locator)
+        self.attribute = attribute
+        self.value = value
+    
+    def _check(self, element) -> bool:
+        return element.get_attribute(self.attribute) == self.value
+
+
+class _AttrContains(_AttrEquals):
+    """Element attribute contains value"""
+    
+    __slots__ = ()
+    
+    def _check(self, element) -> bool:
+        attr_value = element.get_attribute(self.attribute)
+        return attr_value and self.value in attr_value
+
+
+class _CssProp(_AttrEquals):
+    """Element CSS property equals value (attribute holds the property name)"""
+    
+    __slots__ = ()
+    
+    def _check(self, element) -> bool:
+        return element.value_of_css_property(self.attribute) == self.value
+
+
+class _Selected(_ElementCondition):
+    """Element is selected"""
+    
+    __slots__ = ()
+    
+    def _check(self, element) -> bool:
+        return element.is_selected()
+
+
+class _NotSelected(_ElementCondition):
+    """Element is not selected"""
+    
+    __slots__ = ()
+    
+    def _check(self, element) -> bool:
+        return not element.is_selected()
+
+
+class _AllChecks(_ElementCondition):
+    """Every check passes for the element (returns the element)"""
+    
+    __slots__ = ("checks",)
+    
+    def __init__(self, locator: Tuple, checks: Tuple[Callable, ...]):
+        super().__init__(locator)
+        self.checks = checks
+    
+    def _check(self, element):
+        return element if all(check(element) for check in self.checks) else False
+
+
+class _CountEquals:
+    """Exact number of elements present"""
+    
+    __slots__ = ("locator", "count")
+    
+    def __init__(self, locator: Tuple, count: int):
+        self.locator = locator
+        self.count = count
+    
+    def __call__(self, driver):
+        try:
+            return _count_elements(driver, self.locator) == self.count
+        except (NoSuchElementException, StaleElementReferenceException):
+            return False
+
+
+class _CountMoreThan(_CountEquals):
+    """More than count elements present"""
+    
+    __slots__ = ()
+    
+    def __call__(self, driver):
+        try:
+            return _count_elements(driver, self.locator) > self.count
+        except (NoSuchElementException, StaleElementReferenceException):
+            return False
+
+
+class _MemoizedCondition:
+    """Wait predicate over a sampled browser value that skips re-evaluation while it is unchanged"""
+    
+    __slots__ = ("_last_value", "_last_result")
+    
+    def __init__(self):
+        self._last_value = None
+        self._last_result = False
+    
+    def _sample(self, driver) -> str:
+        """Read the value to test (one WebDriver round trip per poll)"""
+        raise NotImplementedError
+    
+    def _test(self, value: str) -> bool:
+        """Evaluate the condition against a newly sampled value"""
+        raise NotImplementedError
+    
+    def __call__(self, driver):
+        value = self._sample(driver)
+        if value != self._last_value:
+            self._last_value = value
+            self._last_result = self._test(value)
+        return self._last_result
+
+
+class _UrlContains(_MemoizedCondition):
+    """Current URL contains substring"""
+    
+    __slots__ = ("substring",)
+    
+    def __init__(self, substring: str):
+        super().__init__()
+        self.substring = substring
+    
+    def _sample(self, driver) -> str:
+        return driver.current_url
+    
+    def _test(self, value: str) -> bool:
+        return self.substring in value
+
+
+class _UrlMatches(_MemoizedCondition):
+    """Current URL matches precompiled regex"""
+    
+    __slots__ = ("pattern",)
+    
+    def __init__(self, pattern: str):
+        super().__init__()
+        self.pattern = re.compile(pattern)
+    
+    def _sample(self, driver) -> str:
+        return driver.current_url
+    
+    def _test(self, value: str) -> bool:
+        return self.pattern.search(value) is not None
+
+
+class _TitleContains(_UrlContains):
+    """Page title contains substring"""
+    
+    __slots__ = ()
+    
+    def _sample(self, driver) -> str:
+        return driver.title
+
+
+class _NewWindow:
+    """More windows open than initially"""
+    
+    __slots__ = ("initial_count",)
+    
+    def __init__(self, initial_count: int):
+        self.initial_count = initial_count
+    
+    def __call__(self, driver):
+        return len(driver.window_handles) > self.initial_count
+
+
 class CustomWaitConditions:
     """Custom wait conditions extending Selenium's built-in conditions"""
     
@@ -25,13 +285,7 @@ class CustomWaitConditions:
         Returns:
             Condition function
         """
-        def _predicate(driver):
-            try:
-                element = driver.find_element(*locator)
-                return element.text == text
-            except NoSuchElementException:
-                return False
-        return _predicate
+        return _TextEquals(locator, text)
     
     @staticmethod
     def element_text_contains(locator: Tuple, text: str):
@@ -45,13 +299,7 @@ class CustomWaitConditions:
         Returns:
             Condition function
         """
-        def _predicate(driver):
-            try:
-                element = driver.find_element(*locator)
-                return text in element.text
-            except NoSuchElementException:
-                return False
-        return _predicate
+        return _TextContains(locator, text)
     
     @staticmethod
     def element_attribute_to_be(locator: Tuple, attribute: str, value: str):
@@ -66,13 +314,7 @@ class CustomWaitConditions:
         Returns:
             Condition function
         """
-        def _predicate(driver):
-            try:
-                element = driver.find_element(*locator)
-                return element.get_attribute(attribute) == value
-            except NoSuchElementException:
-                return False
-        return _predicate
+        return _AttrEquals(locator, attribute, value)
     
     @staticmethod
     def element_attribute_contains(locator: Tuple, attribute: str, value: str):
@@ -87,14 +329,7 @@ class CustomWaitConditions:
         Returns:
             Condition function
         """
-        def _predicate(driver):
-            try:
-                element = driver.find_element(*locator)
-                attr_value = element.get_attribute(attribute)
-                return attr_value and value in attr_value
-            except NoSuchElementException:
-                return False
-        return _predicate
+        return _AttrContains(locator, attribute, value)
     
     @staticmethod
     def number_of_elements_to_be(locator: Tuple, count: int):
@@ -108,13 +343,7 @@ class CustomWaitConditions:
         Returns:
             Condition function
         """
-        def _predicate(driver):
-            try:
-                elements = driver.find_elements(*locator)
-                return len(elements) == count
-            except NoSuchElementException:
-                return False
-        return _predicate
+        return _CountEquals(locator, count)
     
     @staticmethod
     def number_of_elements_more_than(locator: Tuple, count: int):
@@ -128,13 +357,7 @@ class CustomWaitConditions:
         Returns:
             Condition function
         """
-        def _predicate(driver):
-            try:
-                elements = driver.find_elements(*locator)
-                return len(elements) > count
-            except NoSuchElementException:
-                return False
-        return _predicate
+        return _CountMoreThan(locator, count)
     
     @staticmethod
     def element_to_be_selected(locator: Tuple):
@@ -147,13 +370,7 @@ class CustomWaitConditions:
         Returns:
             Condition function
         """
-        def _predicate(driver):
-            try:
-                element = driver.find_element(*locator)
-                return element.is_selected()
-            except NoSuchElementException:
-                return False
-        return _predicate
+        return _Selected(locator)
     
     @staticmethod
     def element_to_be_not_selected(locator: Tuple):
@@ -166,13 +383,7 @@ class CustomWaitConditions:
         Returns:
             Condition function
         """
-        def _predicate(driver):
-            try:
-                element = driver.find_element(*locator)
-                return not element.is_selected()
-            except NoSuchElementException:
-                return False
-        return _predicate
+        return _NotSelected(locator)
     
     @staticmethod
     def url_contains(substring: str):
@@ -185,9 +396,7 @@ class CustomWaitConditions:
         Returns:
             Condition function
         """
-        def _predicate(driver):
-            return substring in driver.current_url
-        return _predicate
+        return _UrlContains(substring)
     
     @staticmethod
     def url_matches(pattern: str):
@@ -200,10 +409,7 @@ class CustomWaitConditions:
         Returns:
             Condition function
         """
-        import re
-        def _predicate(driver):
-            return re.search(pattern, driver.current_url) is not None
-        return _predicate
+        return _UrlMatches(pattern)
     
     @staticmethod
     def title_contains(substring: str):
@@ -216,9 +422,7 @@ class CustomWaitConditions:
         Returns:
             Condition function
         """
-        def _predicate(driver):
-            return substring in driver.title
-        return _predicate
+        return _TitleContains(substring)
     
     @staticmethod
     def element_css_property_to_be(locator: Tuple, property_name: str, value: str):
@@ -233,13 +437,7 @@ class CustomWaitConditions:
         Returns:
             Condition function
         """
-        def _predicate(driver):
-            try:
-                element = driver.find_element(*locator)
-                return element.value_of_css_property(property_name) == value
-            except NoSuchElementException:
-                return False
-        return _predicate
+        return _CssProp(locator, property_name, value)
     
     @staticmethod
     def new_window_is_opened(initial_window_count: int):
@@ -252,10 +450,53 @@ class CustomWaitConditions:
         Returns:
             Condition function
         """
+        return _NewWindow(initial_window_count)
+    
+    @staticmethod
+    def all_of(*conditions: Callable):
+        """
+        Wait until every condition is met, evaluated together on each poll
+        
+        Args:
+            conditions: Condition functions taking the driver
+        
+        Returns:
+            Condition function (short-circuits on the first falsy result)
+        """
         def _predicate(driver):
-            return len(driver.window_handles) > initial_window_count
+            return all(condition(driver) for condition in conditions)
         return _predicate
     
+    @staticmethod
+    def any_of(*conditions: Callable):
+        """
+        Wait until at least one condition is met, evaluated together on each poll
+        
+        Args:
+            conditions: Condition functions taking the driver
+        
+        Returns:
+            Condition function (short-circuits on the first truthy result)
+        """
+        def _predicate(driver):
+            return any(condition(driver) for condition in conditions)
+        return _predicate
+    
+    @staticmethod
+    def batch_for_locator(locator: Tuple, *checks: Callable):
+        """
+        Wait until all element checks pass, reusing the located element across polls
+        
+        Args:
+            locator: Tuple of (By, locator_value)
+            checks: Functions taking the WebElement and returning boolean,
+                e.g. lambda e: e.is_displayed(), lambda e: e.text == "x"
+        
+        Returns:
+            Condition function returning the element once all checks pass
+        """
+        return _AllChecks(locator, checks)
+    
     @staticmethod
     def custom_condition(condition_func: Callable):
         """
@@ -285,51 +526,72 @@ class SmartWait:
         self.driver = driver
         self.timeout = timeout
         self.poll_frequency = poll_frequency
+        self._wait = self._build_wait(timeout)
+        self._wait_cache = {}
+    
+    def _build_wait(self, timeout: int) -> WebDriverWait:
+        """Build a WebDriverWait that retries transient DOM churn on the next poll"""
+        return WebDriverWait(
+            self.driver,
+            timeout,
+            poll_frequency=self.poll_frequency,
+            ignored_exceptions=(StaleElementReferenceException, NoSuchElementException)
+        )
+    
+    def _get_wait(self, timeout: int = None) -> WebDriverWait:
+        """
+        Get WebDriverWait for timeout, building one only for non-default values
+        
+        Args:
+            timeout: Custom timeout in seconds (None uses the SmartWait timeout)
+        
+        Returns:
+            Cached WebDriverWait instance
+        """
+        if timeout is None or timeout == self.timeout:
+            return self._wait
+        wait = self._wait_cache.get(timeout)
+        if wait is None:
+            wait = self._build_wait(timeout)
+            self._wait_cache[timeout] = wait
+        return wait
     
-    def until(self, condition, message: str = "") -> any:
+    def until(self, condition, message: str = "", timeout: int = None) -> any:
         """
         Wait until condition is true
         
         Args:
             condition: Wait condition
             message: Error message if timeout
+            timeout: Custom timeout in seconds for this call
         
         Returns:
             Result from condition
         """
         try:
-            wait = WebDriverWait(
-                self.driver,
-                self.timeout,
-                poll_frequency=self.poll_frequency
-            )
-            result = wait.until(condition)
-            logger.debug(f"Wait condition met: {message or 'Custom condition'}")
+            result = self._get_wait(timeout).until(condition)
+            logger.debug("Wait condition met: %s", message or 'Custom condition')
             return result
         except TimeoutException:
             error_msg = f"Timeout waiting for: {message or 'condition'}"
             logger.error(error_msg)
             raise TimeoutException(error_msg)
     
-    def until_not(self, condition, message: str = "") -> any:
+    def until_not(self, condition, message: str = "", timeout: int = None) -> any:
         """
         Wait until condition becomes false
         
         Args:
             condition: Wait condition
             message: Error message if timeout
+            timeout: Custom timeout in seconds for this call
         
         Returns:
             Result from condition
         """
         try:
-            wait = WebDriverWait(
-                self.driver,
-                self.timeout,
-                poll_frequency=self.poll_frequency
-            )
-            result = wait.until_not(condition)
-            logger.debug(f"Wait condition met (not): {message or 'Custom condition'}")
+            result = self._get_wait(timeout).until_not(condition)
+            logger.debug("Wait condition met (not): %s", message or 'Custom condition')
             return result
         except TimeoutException:
             error_msg = f"Timeout waiting for not: {message or 'condition'}"
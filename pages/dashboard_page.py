@@ -4,8 +4,13 @@ Page object for the dashboard/products page (after login)
 """
 
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 from core.base_page import BasePage
 from utils.logger import logger
+from typing import Dict, Iterable
+
+
+_HREFS_JS = "return Array.from(document.querySelectorAll(arguments[0]), a => a.href || '');"
 
 
 class DashboardPage(BasePage):
@@ -28,6 +33,36 @@ class DashboardPage(BasePage):
     SOCIAL_FACEBOOK = (By.CSS_SELECTOR, "a[href*='facebook']")
     SOCIAL_LINKEDIN = (By.CSS_SELECTOR, "a[href*='linkedin']")
     
+    # Platform name -> social link locator
+    _SOCIAL_LINKS = {
+        "twitter": SOCIAL_TWITTER,
+        "facebook": SOCIAL_FACEBOOK,
+        "linkedin": SOCIAL_LINKEDIN
+    }
+    
+    # Union of the social locators above, resolved with a single lookup
+    SOCIAL_LINKS_CSS = "a[href*='twitter'], a[href*='facebook'], a[href*='linkedin']"
+    
+    # Logged-in header elements and URL read in a single snapshot
+    LOGGED_IN_SNAPSHOT = (
+        "{url: location.href,"
+        " logo: !!document.querySelector('.app_logo'),"
+        " menu: !!document.getElementById('react-burger-menu-btn'),"
+        " cart: !!document.querySelector('.shopping_cart_link')}"
+    )
+    
+    # Logged-in snapshot plus visibility of the dashboard logo and title (is_displayed)
+    DISPLAYED_SNAPSHOT = (
+        "{url: location.href,"
+        " logo: (e => !!e && e.getClientRects().length > 0)(document.querySelector('.app_logo')),"
+        " title: (e => !!e && e.getClientRects().length > 0)(document.querySelector('.title')),"
+        " menu: !!document.getElementById('react-burger-menu-btn'),"
+        " cart: !!document.querySelector('.shopping_cart_link')}"
+    )
+    
+    # CSS forms of the locators above for zero-wait script checks
+    FOOTER_CSS = ".footer"
+    
     def __init__(self, driver):
         """Initialize dashboard page"""
         super().__init__(driver)
@@ -40,8 +75,7 @@ class DashboardPage(BasePage):
             True if dashboard is displayed
         """
         logger.info("Checking if dashboard page is displayed")
-        return self.is_element_visible(self.APP_LOGO, timeout=10) and \
-               self.is_element_visible(self.PAGE_TITLE, timeout=5)
+        return self.wait_all_visible([self.APP_LOGO, self.PAGE_TITLE], timeout=10)
     
     def get_page_title(self) -> str:
         """
@@ -51,7 +85,7 @@ class DashboardPage(BasePage):
             Page title
         """
         title = self.get_text(self.PAGE_TITLE)
-        logger.info(f"Dashboard page title: {title}")
+        logger.info("Dashboard page title: %s", title)
         return title
     
     def get_welcome_message(self) -> str:
@@ -64,7 +98,7 @@ class DashboardPage(BasePage):
         # Since SauceDemo doesn't have explicit welcome message,
         # we return app name from logo
         app_name = self.get_text(self.APP_LOGO)
-        logger.info(f"App name: {app_name}")
+        logger.info("App name: %s", app_name)
         return app_name
     
     def get_cart_item_count(self) -> int:
@@ -74,15 +108,9 @@ class DashboardPage(BasePage):
         Returns:
             Number of items (0 if empty)
         """
-        try:
-            if self.is_element_present(self.SHOPPING_CART_BADGE, timeout=2):
-                count_text = self.get_text(self.SHOPPING_CART_BADGE)
-                count = int(count_text) if count_text else 0
-                logger.info(f"Cart item count: {count}")
-                return count
-        except Exception as e:
-            logger.debug(f"No items in cart or error: {str(e)}")
-        return 0
+        count = self.js_cart_count()
+        logger.info("Cart item count: %s", count)
+        return count
     
     def click_shopping_cart(self):
         """Navigate to shopping cart"""
@@ -90,40 +118,46 @@ class DashboardPage(BasePage):
         self.click(self.SHOPPING_CART_LINK)
         return self
     
-    def open_menu(self):
-        """Open burger menu"""
+    def open_menu(self, wait_for: tuple = None):
+        """
+        Open burger menu
+        
+        Args:
+            wait_for: Menu link to wait for, so callers wait once on the link they
+                click next (defaults to LOGOUT_LINK)
+        """
         logger.info("Opening burger menu")
         self.click(self.BURGER_MENU_BUTTON)
         # Wait for menu to be visible
-        self.wait_for_element_visible(self.LOGOUT_LINK)
+        self.wait_for_element_visible(wait_for or self.LOGOUT_LINK)
         return self
     
     def logout(self):
         """Logout from application"""
         logger.info("Logging out from dashboard")
-        self.open_menu()
-        self.click(self.LOGOUT_LINK)
+        self.open_menu(wait_for=self.LOGOUT_LINK)
+        self.click(self.LOGOUT_LINK, skip_wait=True)
         return self
     
     def navigate_to_all_items(self):
         """Navigate to all items page"""
         logger.info("Navigating to all items")
-        self.open_menu()
-        self.click(self.ALL_ITEMS_LINK)
+        self.open_menu(wait_for=self.ALL_ITEMS_LINK)
+        self.click(self.ALL_ITEMS_LINK, skip_wait=True)
         return self
     
     def navigate_to_about(self):
         """Navigate to about page"""
         logger.info("Navigating to about page")
-        self.open_menu()
-        self.click(self.ABOUT_LINK)
+        self.open_menu(wait_for=self.ABOUT_LINK)
+        self.click(self.ABOUT_LINK, skip_wait=True)
         return self
     
     def reset_app_state(self):
         """Reset application state"""
         logger.info("Resetting app state")
-        self.open_menu()
-        self.click(self.RESET_APP_LINK)
+        self.open_menu(wait_for=self.RESET_APP_LINK)
+        self.click(self.RESET_APP_LINK, skip_wait=True)
         return self
     
     def get_inventory_count(self) -> int:
@@ -135,17 +169,20 @@ class DashboardPage(BasePage):
         """
         items = self.find_elements(self.INVENTORY_ITEMS)
         count = len(items)
-        logger.info(f"Found {count} inventory items")
+        logger.info("Found %s inventory items", count)
         return count
     
     def is_footer_displayed(self) -> bool:
         """
         Check if footer is displayed
         
+        The footer renders with the page, so this checks once instead of
+        waiting for it to appear.
+        
         Returns:
-            True if footer visible
+            True if footer present
         """
-        return self.is_element_visible(self.FOOTER, timeout=5)
+        return self.js_exists(self.FOOTER_CSS)
     
     def get_footer_text(self) -> str:
         """
@@ -156,6 +193,20 @@ class DashboardPage(BasePage):
         """
         return self.get_text(self.FOOTER)
     
+    def _batch_present(self, css_union: str, expected_markers: Iterable[str]) -> Dict[str, bool]:
+        """
+        Check several links with one zero-wait script call
+        
+        Args:
+            css_union: Comma-separated CSS selector matching all candidate links
+            expected_markers: Substrings expected in the links' href attributes
+        
+        Returns:
+            Dictionary of marker -> True if a matching link is present
+        """
+        hrefs = self.execute_script(_HREFS_JS, css_union)
+        return {marker: any(marker in href for href in hrefs) for marker in expected_markers}
+    
     def is_social_links_present(self) -> bool:
         """
         Check if social media links are present
@@ -163,12 +214,9 @@ class DashboardPage(BasePage):
         Returns:
             True if all social links present
         """
-        twitter = self.is_element_present(self.SOCIAL_TWITTER, timeout=2)
-        facebook = self.is_element_present(self.SOCIAL_FACEBOOK, timeout=2)
-        linkedin = self.is_element_present(self.SOCIAL_LINKEDIN, timeout=2)
-        
-        all_present = twitter and facebook and linkedin
-        logger.info(f"Social links present: {all_present}")
+        present = self._batch_present(self.SOCIAL_LINKS_CSS, self._SOCIAL_LINKS)
+        all_present = all(present.values())
+        logger.info("Social links present: %s", all_present)
         return all_present
     
     def click_social_link(self, platform: str):
@@ -178,18 +226,13 @@ class DashboardPage(BasePage):
         Args:
             platform: Social platform (twitter, facebook, linkedin)
         """
-        logger.info(f"Clicking {platform} social link")
-        
-        social_links = {
-            "twitter": self.SOCIAL_TWITTER,
-            "facebook": self.SOCIAL_FACEBOOK,
-            "linkedin": self.SOCIAL_LINKEDIN
-        }
+        logger.info("Clicking %s social link", platform)
         
-        if platform.lower() in social_links:
-            self.click(social_links[platform.lower()])
+        locator = self._SOCIAL_LINKS.get(platform.lower())
+        if locator:
+            self.click(locator)
         else:
-            logger.error(f"Unknown social platform: {platform}")
+            logger.error("Unknown social platform: %s", platform)
         
         return self
     
@@ -201,14 +244,40 @@ class DashboardPage(BasePage):
             True if logged in
         """
         logger.info("Verifying user is logged in")
+        is_logged_in = self._wait_for_snapshot(self.LOGGED_IN_SNAPSHOT, timeout=5)
+        logger.info("User logged in: %s", is_logged_in)
+        return is_logged_in
+    
+    def is_displayed_and_logged_in(self) -> bool:
+        """
+        Check is_displayed and verify_user_logged_in together in a single wait
         
-        checks = [
-            self.is_element_visible(self.APP_LOGO, timeout=5),
-            self.is_element_visible(self.BURGER_MENU_BUTTON, timeout=5),
-            self.is_element_visible(self.SHOPPING_CART_LINK, timeout=5),
-            "inventory" in self.get_current_url().lower()
-        ]
+        Returns:
+            True if the dashboard is displayed for a logged-in user
+        """
+        logger.info("Checking dashboard is displayed for a logged-in user")
+        is_ready = self._wait_for_snapshot(self.DISPLAYED_SNAPSHOT, timeout=10)
+        logger.info("Dashboard displayed and logged in: %s", is_ready)
+        return is_ready
+    
+    def _wait_for_snapshot(self, js_expression: str, timeout: int) -> bool:
+        """
+        Poll a page-state snapshot until the URL is the inventory and every other field is truthy
+        
+        Args:
+            js_expression: JavaScript object literal with a 'url' field
+            timeout: Timeout in seconds
         
-        is_logged_in = all(checks)
-        logger.info(f"User logged in: {is_logged_in}")
-        return is_logged_in
\ No newline at end of file
+        Returns:
+            True if the state was reached in time
+        """
+        def _ready(driver):
+            state = self.snapshot(js_expression)
+            state['url'] = "inventory" in state['url'].lower()
+            return all(state.values())
+        
+        # One round trip per poll for all elements and the URL together
+        try:
+            return self._wait(timeout).until(_ready)
+        except TimeoutException:
+            return False
\ No newline at end of file
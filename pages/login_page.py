@@ -3,12 +3,22 @@ Login Page Object
 Page object for the login page with locators and actions
 """
 
+import re
 from selenium.webdriver.common.by import By
 from core.base_page import BasePage
+from core.js_snippets import SET_NATIVE_VALUE_JS
 from config.config import config
 from utils.logger import logger
 
 
+# Fill both fields through the native value setter (so React sees the change) and submit
+_FORCE_LOGIN_JS = SET_NATIVE_VALUE_JS + """
+setNativeValue(document.getElementById('user-name'), arguments[0]);
+setNativeValue(document.getElementById('password'), arguments[1]);
+document.getElementById('login-button').click();
+"""
+
+
 class LoginPage(BasePage):
     """Login page object class"""
     
@@ -21,14 +31,18 @@ class LoginPage(BasePage):
     LOGIN_LOGO = (By.CLASS_NAME, "login_logo")
     LOGIN_CREDENTIALS = (By.ID, "login_credentials")
     
+    # Non-empty credential lines except the "Accepted usernames are:" header
+    _USER_RE = re.compile(r'^(?!Accepted)[ \t]*(\S.*?)[ \t]*$', re.M)
+    
     def __init__(self, driver):
         """Initialize login page"""
         super().__init__(driver)
         self.url = config.base_url
+        self.inventory_url = f"{config.base_url}/inventory.html"
     
     def navigate(self):
         """Navigate to login page"""
-        logger.info(f"Navigating to login page: {self.url}")
+        logger.info("Navigating to login page: %s", self.url)
         self.navigate_to(self.url)
         return self
     
@@ -40,8 +54,7 @@ class LoginPage(BasePage):
             True if login page is displayed
         """
         logger.info("Checking if login page is displayed")
-        return self.is_element_visible(self.LOGIN_LOGO) and \
-               self.is_element_visible(self.USERNAME_INPUT)
+        return self.wait_all_visible([self.LOGIN_LOGO, self.USERNAME_INPUT])
     
     def enter_username(self, username: str):
         """
@@ -50,7 +63,7 @@ class LoginPage(BasePage):
         Args:
             username: Username to enter
         """
-        logger.info(f"Entering username: {username}")
+        logger.info("Entering username: %s", username)
         self.type_text(self.USERNAME_INPUT, username)
         return self
     
@@ -79,12 +92,57 @@ class LoginPage(BasePage):
             username: Username
             password: Password
         """
-        logger.info(f"Performing login with username: {username}")
+        logger.info("Performing login with username: %s", username)
         self.enter_username(username)
         self.enter_password(password)
         self.click_login_button()
         return self
     
+    def force_login(self, username: str, password: str):
+        """
+        Replace both field values and submit in one script call
+        
+        Use instead of clear_username + clear_password + login when retrying
+        on a page that already has input in the fields.
+        
+        Args:
+            username: Username
+            password: Password
+        """
+        logger.info("Forcing login with username: %s", username)
+        self.execute_script(_FORCE_LOGIN_JS, username, password)
+        self._invalidate_caches()
+        return self
+    
+    def login_with_session(self, username: str, password: str, cookie_cache: dict):
+        """
+        Log in by restoring cached session cookies, falling back to the login form
+        
+        After a form login the resulting cookies are stored in cookie_cache, so
+        later calls for the same user skip the form entirely.
+        
+        Args:
+            username: Username
+            password: Password
+            cookie_cache: Dict of username -> cookies, shared across calls
+        """
+        cookies = cookie_cache.get(username)
+        if cookies:
+            logger.info("Restoring session cookies for: %s", username)
+            if not hasattr(self.driver, "execute_cdp_cmd"):
+                self.navigate()  # add_cookie needs a page on the cookie's domain
+            self.add_cookies(cookies)
+            self.navigate_to(self.inventory_url)
+            if "inventory" in self.get_current_url():
+                return self
+            logger.warning("Cached session rejected, logging in through the form")
+        
+        self.navigate()
+        self.login(username, password)
+        if "inventory" in self.get_current_url():
+            cookie_cache[username] = self.driver.get_cookies()
+        return self
+    
     def get_error_message(self) -> str:
         """
         Get error message text
@@ -118,12 +176,7 @@ class LoginPage(BasePage):
             List of usernames
         """
         credentials_text = self.get_text(self.LOGIN_CREDENTIALS)
-        # Parse usernames from credentials text
-        usernames = []
-        for line in credentials_text.split('\n'):
-            if line and not line.startswith('Accepted'):
-                usernames.append(line.strip())
-        return usernames
+        return self._USER_RE.findall(credentials_text)
     
     def clear_username(self):
         """Clear username field"""
@@ -144,4 +197,4 @@ class LoginPage(BasePage):
         Returns:
             True if button is enabled
         """
-        return self.find_element(self.LOGIN_BUTTON).is_enabled()
\ No newline at end of file
+        return self.js_is_enabled("#login-button")
\ No newline at end of file
@@ -3,10 +3,32 @@ Products Page Object
 Page object for the products/inventory page
 """
 
+import re
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 from core.base_page import BasePage
+from config.config import config
 from utils.logger import logger
-from typing import List
+from typing import List, Dict, Any, Tuple
+
+
+# Name, price and cart state of every inventory item in a single DOM pass
+_INVENTORY_JS = """
+return Array.from(document.querySelectorAll('.inventory_item'), i => ({
+    name: i.querySelector('.inventory_item_name').textContent.trim(),
+    price: i.querySelector('.inventory_item_price').textContent.trim(),
+    inCart: !!i.querySelector('button[id^=remove]')
+}));
+"""
+
+# Numeric part of a displayed price such as "$29.99"
+_PRICE_RE = re.compile(r"\d+(?:\.\d+)?")
+
+
+def _price_value(price: str):
+    """Parse a displayed price to float, or None if it has no numeric part"""
+    match = _PRICE_RE.search(price)
+    return float(match.group()) if match else None
 
 
 class ProductsPage(BasePage):
@@ -28,6 +50,13 @@ class ProductsPage(BasePage):
     def __init__(self, driver):
         """Initialize products page"""
         super().__init__(driver)
+        self.url = f"{config.base_url}/inventory.html"
+    
+    def navigate(self):
+        """Navigate to products page (requires a logged-in session)"""
+        logger.info("Navigating to products page: %s", self.url)
+        self.navigate_to(self.url)
+        return self
     
     def is_displayed(self) -> bool:
         """
@@ -58,7 +87,7 @@ class ProductsPage(BasePage):
         """
         products = self.find_elements(self.PRODUCT_ITEMS)
         count = len(products)
-        logger.info(f"Found {count} products")
+        logger.info("Found %s products", count)
         return count
     
     def get_all_product_names(self) -> List[str]:
@@ -68,9 +97,8 @@ class ProductsPage(BasePage):
         Returns:
             List of product names
         """
-        elements = self.find_elements(self.PRODUCT_NAMES)
-        names = [elem.text for elem in elements]
-        logger.info(f"Product names: {names}")
+        names = self.get_texts_by_css(".inventory_item_name")
+        logger.info("Product names: %s", names)
         return names
     
     def get_all_product_prices(self) -> List[str]:
@@ -80,11 +108,44 @@ class ProductsPage(BasePage):
         Returns:
             List of product prices
         """
-        elements = self.find_elements(self.PRODUCT_PRICES)
-        prices = [elem.text for elem in elements]
-        logger.info(f"Product prices: {prices}")
+        prices = self.get_texts_by_css(".inventory_item_price")
+        logger.info("Product prices: %s", prices)
         return prices
     
+    def snapshot_inventory(self, timeout: int = None) -> List[Dict[str, Any]]:
+        """
+        Get name, price and cart state of every product in one script call
+        
+        Use instead of get_all_product_names / get_all_product_prices /
+        is_product_in_cart when several fields are needed for the same state.
+        
+        Args:
+            timeout: Custom timeout in seconds to wait for the inventory to render
+        
+        Returns:
+            List of dicts with 'name', 'price' (displayed text), 'price_value'
+            (float, None if unparseable) and 'in_cart' keys, in page order
+            (empty if no products rendered in time)
+        """
+        try:
+            items = self._wait(timeout).until(
+                lambda driver: driver.execute_script(_INVENTORY_JS) or False
+            )
+        except TimeoutException:
+            logger.error("Inventory items not found")
+            return []
+        snapshot = [
+            {
+                'name': item['name'],
+                'price': item['price'],
+                'price_value': _price_value(item['price']),
+                'in_cart': bool(item['inCart'])
+            }
+            for item in items
+        ]
+        logger.info("Inventory snapshot: %s products", len(snapshot))
+        return snapshot
+    
     def add_product_to_cart_by_name(self, product_name: str):
         """
         Add product to cart by product name
@@ -92,13 +153,29 @@ class ProductsPage(BasePage):
         Args:
             product_name: Name of the product
         """
-        logger.info(f"Adding product to cart: {product_name}")
+        logger.info("Adding product to cart: %s", product_name)
         # Convert product name to button ID format
         product_id = product_name.lower().replace(' ', '-')
         add_button = (By.ID, f"add-to-cart-{product_id}")
         self.click(add_button)
         return self
     
+    def add_products_to_cart_by_name(self, *product_names: str):
+        """
+        Add several products to cart by name with one script call
+        
+        Args:
+            *product_names: Names of the products
+        """
+        logger.info("Adding products to cart: %s", product_names)
+        css = ", ".join(
+            f'[id="add-to-cart-{name.lower().replace(" ", "-")}"]' for name in product_names
+        )
+        clicked, _ = self._click_add_buttons(None, css)
+        if clicked != len(product_names):
+            logger.warning("Added %s of %s products", clicked, len(product_names))
+        return self
+    
     def remove_product_from_cart_by_name(self, product_name: str):
         """
         Remove product from cart by product name
@@ -106,25 +183,72 @@ class ProductsPage(BasePage):
         Args:
             product_name: Name of the product
         """
-        logger.info(f"Removing product from cart: {product_name}")
+        logger.info("Removing product from cart: %s", product_name)
         product_id = product_name.lower().replace(' ', '-')
         remove_button = (By.ID, f"remove-{product_id}")
         self.click(remove_button)
         return self
     
-    def add_first_n_products_to_cart(self, count: int = 1):
+    def add_first_n_products_to_cart(self, count: int = 1, native: bool = False):
         """
         Add first N products to cart
         
         Args:
             count: Number of products to add
+            native: Click each button through WebDriver instead of one
+                JavaScript batch, for tests that need real user input
         """
-        logger.info(f"Adding first {count} products to cart")
+        logger.info("Adding first %s products to cart", count)
+        if not native:
+            self._click_add_buttons(count)
+            return self
         buttons = self.find_elements(self.ADD_TO_CART_BUTTONS)
         for i in range(min(count, len(buttons))):
             buttons[i].click()
         return self
     
+    def add_first_n_and_count(self, count: int = 1) -> int:
+        """
+        Add first N products to cart and read the cart count in one script call
+        
+        Args:
+            count: Number of products to add
+        
+        Returns:
+            Number of items in cart badge after adding
+        """
+        logger.info("Adding first %s products to cart and reading count", count)
+        return self._click_add_buttons(count)[1]
+    
+    def add_all_and_count(self) -> Tuple[int, int]:
+        """
+        Add every product not yet in the cart and read the cart count in one script call
+        
+        Returns:
+            Tuple of (products added, items in cart badge after adding)
+        """
+        logger.info("Adding all products to cart and reading count")
+        return self._click_add_buttons(None)
+    
+    def _click_add_buttons(self, limit, css: str = None) -> Tuple[int, int]:
+        """
+        Click up to limit add-to-cart buttons (all when None) and read the cart badge
+        
+        Args:
+            limit: Maximum number of buttons to click, or None for all
+            css: Selector for the buttons to click (defaults to every Add button)
+        
+        Returns:
+            Tuple of (buttons clicked, cart badge count)
+        """
+        css = css or self.ADD_TO_CART_BUTTONS[1]
+        clicked, cart_count = self.js_click_all_and_count(css, limit)
+        # Retry once after waiting for the inventory if it hadn't rendered yet;
+        # a rendered inventory with no Add buttons (full cart) returns at once
+        if not clicked and self.is_element_present(self.PRODUCT_ITEMS, timeout=None):
+            clicked, cart_count = self.js_click_all_and_count(css, limit)
+        return clicked, cart_count
+    
     def get_cart_item_count(self) -> int:
         """
         Get number of items in cart
@@ -132,12 +256,9 @@ class ProductsPage(BasePage):
         Returns:
             Number of items in cart badge
         """
-        if self.is_element_present(self.SHOPPING_CART_BADGE, timeout=2):
-            count = int(self.get_text(self.SHOPPING_CART_BADGE))
-            logger.info(f"Cart item count: {count}")
-            return count
-        logger.info("Cart is empty")
-        return 0
+        count = self.js_cart_count()
+        logger.info("Cart item count: %s", count)
+        return count
     
     def click_shopping_cart(self):
         """Click shopping cart icon"""
@@ -165,7 +286,7 @@ class ProductsPage(BasePage):
         Args:
             sort_option: Sort option (az, za, lohi, hilo)
         """
-        logger.info(f"Sorting products by: {sort_option}")
+        logger.info("Sorting products by: %s", sort_option)
         from selenium.webdriver.support.ui import Select
         dropdown = self.find_element(self.PRODUCT_SORT_DROPDOWN)
         select = Select(dropdown)
@@ -183,5 +304,4 @@ class ProductsPage(BasePage):
             True if product is in cart
         """
         product_id = product_name.lower().replace(' ', '-')
-        remove_button = (By.ID, f"remove-{product_id}")
-        return self.is_element_present(remove_button, timeout=2)
\ No newline at end of file
+        return self.js_exists(f'[id="remove-{product_id}"]')
\ No newline at end of file
@@ -5,13 +5,31 @@ Contains pytest fixtures, hooks, and configurations for test execution
 
 import pytest
 import os
+import socket
 from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
+from typing import NamedTuple
+from urllib.parse import urlparse
 from selenium.webdriver.remote.webdriver import WebDriver
 from core.browser_factory import BrowserFactory
+from core.browser_pool import BrowserPool
+from pages.login_page import LoginPage
+from pages.dashboard_page import DashboardPage
+from pages.products_page import ProductsPage
 from config.config import config
 from utils.logger import logger
-from utils.screenshot import capture_screenshot
+from utils.screenshot import save_png_async
+
+
+# Browser settings captured once in pytest_configure so every fixture sees the same values
+_BROWSER = None
+_HEADLESS = None
+
+class Credentials(NamedTuple):
+    """Login credentials; unpack straight into login_page.login(*creds)"""
+    username: str
+    password: str
 
 
 # Command line options
@@ -35,60 +53,153 @@ def pytest_addoption(parser):
         default="dev",
         help="Environment to run tests: dev, staging, prod"
     )
+    parser.addoption(
+        "--remote-url",
+        action="store",
+        default=None,
+        help="Selenium Grid URL to run browsers remotely (overrides REMOTE_URL)"
+    )
+    parser.addoption(
+        "--reuse-driver",
+        action="store_true",
+        default=False,
+        help="Share one browser across the session, resetting cookies and storage between tests"
+    )
+    parser.addoption(
+        "--drivers-per-worker",
+        action="store",
+        type=int,
+        default=0,
+        help="Pool up to N browsers per process (per xdist worker) and reuse them across tests; 0 disables"
+    )
 
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_environment(request):
     """Setup test environment from command line options"""
-    browser = request.config.getoption("--browser")
-    headless = request.config.getoption("--headless").lower() == "true"
+    browser = _BROWSER
+    headless = _HEADLESS
     env = request.config.getoption("--env")
     
     # Set environment variables
     os.environ['BROWSER'] = browser
     os.environ['HEADLESS'] = str(headless)
     os.environ['ENV'] = env
+    remote_url = request.config.getoption("--remote-url")
+    if remote_url:
+        os.environ['REMOTE_URL'] = remote_url
+    config.refresh_env()
+    
+    # Resolve driver binary and build options once, before the first test needs them
+    try:
+        BrowserFactory.prewarm(browser, headless)
+    except Exception as e:
+        logger.warning("Driver prewarm failed, resolving on first use: %s", e)
     
     logger.info("=" * 80)
-    logger.info(f"TEST EXECUTION STARTED")
-    logger.info(f"Browser: {browser}")
-    logger.info(f"Headless: {headless}")
-    logger.info(f"Environment: {env}")
-    logger.info(f"Base URL: {config.base_url}")
+    logger.info("TEST EXECUTION STARTED")
+    logger.info("Browser: %s", browser)
+    logger.info("Headless: %s", headless)
+    logger.info("Environment: %s", env)
+    logger.info("Remote URL: %s", config.remote_url or 'local')
+    logger.info("Base URL: %s", config.base_url)
     logger.info("=" * 80)
     
     yield
     
+    BrowserPool.drain()
+    
     logger.info("=" * 80)
     logger.info("TEST EXECUTION COMPLETED")
     logger.info("=" * 80)
 
 
+@pytest.fixture(scope="session", autouse=True)
+def _warm_dns(setup_environment):
+    """Resolve the application and Grid hosts once per worker so the first navigation skips the DNS lookup"""
+    for url in (config.base_url, config.remote_url):
+        host = urlparse(url).hostname if url else None
+        if not host:
+            continue
+        try:
+            socket.gethostbyname(host)
+        except OSError as e:
+            logger.warning("DNS warm-up failed for %s: %s", host, e)
+
+
+@pytest.fixture(scope="session")
+def session_driver():
+    """
+    Session-level WebDriver fixture - one browser for the whole run
+    
+    Used by the driver fixture when --reuse-driver is passed. Against a Grid
+    (--remote-url) this compounds with the factory's keep-alive connection pool:
+    one remote session and one set of warm connections for the whole run.
+    """
+    logger.info("Initializing session-level WebDriver")
+    driver_instance = BrowserFactory.get_driver(_BROWSER, _HEADLESS)
+    
+    yield driver_instance
+    
+    logger.info("Closing session-level WebDriver")
+    BrowserFactory.quit_driver(driver_instance)
+
+
 @pytest.fixture(scope="function")
 def driver(request):
     """
     WebDriver fixture - creates and tears down driver for each test
     
+    With --reuse-driver, the session browser is shared instead and its
+    cookies and storage are reset after each test. With --drivers-per-worker,
+    a driver is checked out of the process-local BrowserPool and returned after.
+    
     Usage in test:
         def test_example(driver):
             driver.get("https://example.com")
     """
-    browser = config.browser
-    headless = config.headless
+    if request.config.getoption("--reuse-driver"):
+        driver_instance = request.getfixturevalue("session_driver")
+        yield driver_instance
+        BrowserFactory.reset_driver(driver_instance)
+        return
     
-    logger.info(f"Initializing WebDriver for test: {request.node.name}")
+    if BrowserPool.enabled():
+        driver_instance = BrowserPool.acquire(_BROWSER, _HEADLESS)
+        yield driver_instance
+        BrowserPool.release(driver_instance, _BROWSER, _HEADLESS)
+        return
+    
+    logger.info("Initializing WebDriver for test: %s", request.node.name)
     
     # Initialize driver
-    driver_instance = BrowserFactory.get_driver(browser, headless)
+    driver_instance = BrowserFactory.get_driver(_BROWSER, _HEADLESS)
     
     # Make driver available to test
     yield driver_instance
     
     # Teardown
-    logger.info(f"Closing WebDriver for test: {request.node.name}")
+    logger.info("Closing WebDriver for test: %s", request.node.name)
     BrowserFactory.quit_driver(driver_instance)
 
 
+@pytest.fixture(scope="function")
+def pages(driver):
+    """
+    Page objects bound to the test's driver, built once per test
+    
+    Usage in test:
+        def test_example(pages):
+            pages.login.navigate()
+            pages.products.get_product_count()
+    """
+    return SimpleNamespace(
+        login=LoginPage(driver),
+        dashboard=DashboardPage(driver),
+        products=ProductsPage(driver)
+    )
+
+
 @pytest.fixture(scope="class")
 def class_driver(request):
     """
@@ -101,17 +212,14 @@ def class_driver(request):
             def test_one(self):
                 self.driver.get("https://example.com")
     """
-    browser = config.browser
-    headless = config.headless
+    logger.info("Initializing class-level WebDriver for: %s", request.cls.__name__)
     
-    logger.info(f"Initializing class-level WebDriver for: {request.cls.__name__}")
-    
-    driver_instance = BrowserFactory.get_driver(browser, headless)
+    driver_instance = BrowserFactory.get_driver(_BROWSER, _HEADLESS)
     request.cls.driver = driver_instance
     
     yield driver_instance
     
-    logger.info(f"Closing class-level WebDriver for: {request.cls.__name__}")
+    logger.info("Closing class-level WebDriver for: %s", request.cls.__name__)
     BrowserFactory.quit_driver(driver_instance)
 
 
@@ -121,14 +229,14 @@ def pytest_runtest_setup(item):
     """Hook that runs before each test"""
     logger.info("")
     logger.info("*" * 80)
-    logger.info(f"STARTING TEST: {item.name}")
+    logger.info("STARTING TEST: %s", item.name)
     logger.info("*" * 80)
 
 
 def pytest_runtest_teardown(item, nextitem):
     """Hook that runs after each test"""
     logger.info("*" * 80)
-    logger.info(f"COMPLETED TEST: {item.name}")
+    logger.info("COMPLETED TEST: %s", item.name)
     logger.info("*" * 80)
     logger.info("")
 
@@ -152,41 +260,49 @@ def pytest_runtest_makereport(item, call):
         
         # Capture screenshot on failure
         if report.failed and driver_fixture:
-            logger.error(f"TEST FAILED: {item.name}")
+            logger.error("TEST FAILED: %s", item.name)
             test_name = item.name
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             screenshot_name = f"{test_name}_{timestamp}"
             
             try:
-                screenshot_path = capture_screenshot(driver_fixture, screenshot_name)
-                logger.info(f"Screenshot saved: {screenshot_path}")
+                # Only the capture must happen now, the driver may quit right after
+                png_bytes = driver_fixture.get_screenshot_as_png()
+                screenshot_path = Path('screenshots') / f"{screenshot_name}.png"
+                save_png_async(png_bytes, screenshot_path)
                 
-                # Attach screenshot to Allure report if available
+                # Attach screenshot to Allure report if available (from memory, on the
+                # test thread so Allure associates it with the current test)
                 try:
                     import allure
-                    allure.attach.file(
-                        screenshot_path,
+                    allure.attach(
+                        png_bytes,
                         name=screenshot_name,
                         attachment_type=allure.attachment_type.PNG
                     )
                 except ImportError:
                     pass
             except Exception as e:
-                logger.error(f"Failed to capture screenshot: {str(e)}")
+                logger.error("Failed to capture screenshot: %s", e)
         
         # Log test result
         if report.passed:
-            logger.info(f"TEST PASSED: {item.name}")
+            logger.info("TEST PASSED: %s", item.name)
         elif report.failed:
-            logger.error(f"TEST FAILED: {item.name}")
+            logger.error("TEST FAILED: %s", item.name)
             if report.longrepr:
-                logger.error(f"Failure reason: {report.longrepr}")
+                logger.error("Failure reason: %s", report.longrepr)
         elif report.skipped:
-            logger.warning(f"TEST SKIPPED: {item.name}")
+            logger.warning("TEST SKIPPED: %s", item.name)
 
 
 def pytest_configure(config):
     """Configure pytest with custom settings"""
+    global _BROWSER, _HEADLESS
+    _BROWSER = config.getoption("--browser")
+    _HEADLESS = config.getoption("--headless").lower() == "true"
+    BrowserPool.configure(config.getoption("--drivers-per-worker"))
+    
     # Create directories if they don't exist
     Path('reports').mkdir(exist_ok=True)
     Path('screenshots').mkdir(exist_ok=True)
@@ -196,6 +312,7 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "smoke: Quick smoke tests")
     config.addinivalue_line("markers", "regression: Full regression suite")
     config.addinivalue_line("markers", "critical: Critical path tests")
+    config.addinivalue_line("markers", "xdist_group(name): Keep tests on one xdist worker with --dist=loadgroup")
 
 
 def pytest_collection_modifyitems(config, items):
@@ -206,6 +323,12 @@ def pytest_collection_modifyitems(config, items):
         # Skip tests marked with skip_in_ci when running in CI
         if "skip_in_ci" in item.keywords and os.getenv("CI"):
             item.add_marker(skip_in_ci)
+        
+        # With --dist=loadgroup, tests sharing a class browser stay on one worker;
+        # tests with their own driver are left ungrouped and spread across workers
+        if "class_driver" in item.fixturenames and item.cls is not None \
+                and item.get_closest_marker("xdist_group") is None:
+            item.add_marker(pytest.mark.xdist_group(name=item.cls.__name__))
 
 
 # Session fixtures for test data
@@ -216,26 +339,14 @@ def test_users():
     Fixture providing test user credentials
     
     Returns:
-        Dictionary of test users
+        Read-only mapping of user key to Credentials
     """
-    return {
-        "standard_user": {
-            "username": "standard_user",
-            "password": "secret_sauce"
-        },
-        "locked_out_user": {
-            "username": "locked_out_user",
-            "password": "secret_sauce"
-        },
-        "problem_user": {
-            "username": "problem_user",
-            "password": "secret_sauce"
-        },
-        "performance_glitch_user": {
-            "username": "performance_glitch_user",
-            "password": "secret_sauce"
-        }
-    }
+    return MappingProxyType({
+        "standard_user": Credentials("standard_user", "secret_sauce"),
+        "locked_out_user": Credentials("locked_out_user", "secret_sauce"),
+        "problem_user": Credentials("problem_user", "secret_sauce"),
+        "performance_glitch_user": Credentials("performance_glitch_user", "secret_sauce"),
+    })
 
 
 @pytest.fixture(scope="session")
@@ -244,26 +355,28 @@ def invalid_credentials():
     Fixture providing invalid test credentials
     
     Returns:
-        Dictionary of invalid credentials
+        Read-only mapping of case key to Credentials
+    """
+    return MappingProxyType({
+        "invalid_user": Credentials("invalid_user", "invalid_password"),
+        "empty_username": Credentials("", "secret_sauce"),
+        "empty_password": Credentials("standard_user", ""),
+        "empty_both": Credentials("", ""),
+    })
+
+
+@pytest.fixture(scope="session")
+def session_cookies():
+    """
+    Fixture caching login cookies per username for this process
+    
+    Filled by LoginPage.login_with_session on the first real login, so later
+    logged-in fixtures restore the session instead of submitting the form.
+    
+    Returns:
+        Dictionary of username -> cookies
     """
-    return {
-        "invalid_user": {
-            "username": "invalid_user",
-            "password": "invalid_password"
-        },
-        "empty_username": {
-            "username": "",
-            "password": "secret_sauce"
-        },
-        "empty_password": {
-            "username": "standard_user",
-            "password": ""
-        },
-        "empty_both": {
-            "username": "",
-            "password": ""
-        }
-    }
+    return {}
 
 
 # Helper fixtures
@@ -4,10 +4,42 @@ Complete user journey tests from login to checkout
 """
 
 import pytest
+from selenium.webdriver.support.ui import WebDriverWait
 from pages.login_page import LoginPage
 from pages.dashboard_page import DashboardPage
 from pages.products_page import ProductsPage
+from utils.flows import quick_cart_state
 from utils.logger import logger
+from utils.sorting import is_sorted
+
+
+@pytest.fixture(scope="class")
+def logged_in_pages(class_driver, test_users, session_cookies):
+    """
+    Fixture that logs in once per test class and provides the page objects
+    
+    Tests that verify login or logout themselves use the plain driver fixture.
+    
+    Returns:
+        Tuple of (driver, login_page, dashboard_page, products_page)
+    """
+    login_page = LoginPage(class_driver)
+    dashboard_page = DashboardPage(class_driver)
+    products_page = ProductsPage(class_driver)
+    
+    user = test_users["standard_user"]
+    login_page.login_with_session(*user, session_cookies)
+    
+    return class_driver, login_page, dashboard_page, products_page
+
+
+@pytest.fixture
+def shopping_session(logged_in_pages):
+    """Logged-in page objects with an empty cart, starting on the products page"""
+    _, _, dashboard_page, products_page = logged_in_pages
+    dashboard_page.reset_app_state()
+    products_page.navigate()
+    return logged_in_pages
 
 
 @pytest.mark.critical
@@ -16,7 +48,7 @@ class TestE2EWorkflow:
     """End-to-end workflow test suite"""
     
     @pytest.mark.smoke
-    def test_complete_shopping_flow(self, driver, test_users):
+    def test_complete_shopping_flow(self, pages, test_users):
         """
         Test complete shopping workflow
         
@@ -31,45 +63,44 @@ class TestE2EWorkflow:
         logger.info("Starting E2E test: Complete shopping flow")
         
         # Initialize page objects
-        login_page = LoginPage(driver)
-        dashboard_page = DashboardPage(driver)
-        products_page = ProductsPage(driver)
+        login_page = pages.login
+        dashboard_page = pages.dashboard
+        products_page = pages.products
         
         # Step 1: Login
-        logger.info("Step 1: Logging in")
+        logger.debug("Step 1: Logging in")
         user = test_users["standard_user"]
         login_page.navigate()
-        login_page.login(user["username"], user["password"])
+        login_page.login(*user)
         
         # Step 2: Verify dashboard
-        logger.info("Step 2: Verifying dashboard")
-        assert dashboard_page.is_displayed(), "Dashboard is not displayed"
-        assert dashboard_page.verify_user_logged_in(), "User not properly logged in"
+        logger.debug("Step 2: Verifying dashboard")
+        assert dashboard_page.is_displayed_and_logged_in(), \
+            "Dashboard is not displayed or user not properly logged in"
         
         # Step 3: Add products to cart
-        logger.info("Step 3: Adding products to cart")
-        products_page.add_product_to_cart_by_name("sauce-labs-backpack")
-        products_page.add_product_to_cart_by_name("sauce-labs-bike-light")
+        logger.debug("Step 3: Adding products to cart")
+        products_page.add_products_to_cart_by_name("sauce-labs-backpack", "sauce-labs-bike-light")
         
         # Step 4: Verify cart count
-        logger.info("Step 4: Verifying cart count")
+        logger.debug("Step 4: Verifying cart count")
         cart_count = dashboard_page.get_cart_item_count()
         assert cart_count == 2, f"Expected 2 items in cart, got {cart_count}"
         
         # Step 5: Navigate to cart
-        logger.info("Step 5: Navigating to cart")
+        logger.debug("Step 5: Navigating to cart")
         dashboard_page.click_shopping_cart()
-        assert "cart" in driver.current_url, "Not navigated to cart page"
+        assert dashboard_page.wait_for_url_contains("cart"), "Not navigated to cart page"
         
         # Step 6: Logout
-        logger.info("Step 6: Logging out")
+        logger.debug("Step 6: Logging out")
         products_page.logout()
         assert login_page.is_displayed(), "Not redirected to login page after logout"
         
         logger.info("E2E test passed: Complete shopping flow")
     
     @pytest.mark.regression
-    def test_add_remove_products_workflow(self, driver, test_users):
+    def test_add_remove_products_workflow(self, shopping_session):
         """
         Test adding and removing products workflow
         
@@ -82,19 +113,12 @@ class TestE2EWorkflow:
         """
         logger.info("Starting E2E test: Add/Remove products workflow")
         
-        login_page = LoginPage(driver)
-        dashboard_page = DashboardPage(driver)
-        products_page = ProductsPage(driver)
-        
-        # Login
-        user = test_users["standard_user"]
-        login_page.navigate()
-        login_page.login(user["username"], user["password"])
+        driver, login_page, dashboard_page, products_page = shopping_session
         
         # Add products
-        products_page.add_product_to_cart_by_name("sauce-labs-backpack")
-        products_page.add_product_to_cart_by_name("sauce-labs-bike-light")
-        products_page.add_product_to_cart_by_name("sauce-labs-bolt-t-shirt")
+        products_page.add_products_to_cart_by_name(
+            "sauce-labs-backpack", "sauce-labs-bike-light", "sauce-labs-bolt-t-shirt"
+        )
         
         # Verify count
         assert dashboard_page.get_cart_item_count() == 3, "Expected 3 items in cart"
@@ -108,7 +132,7 @@ class TestE2EWorkflow:
         logger.info("E2E test passed: Add/Remove products workflow")
     
     @pytest.mark.regression
-    def test_product_sorting_workflow(self, driver, test_users):
+    def test_product_sorting_workflow(self, shopping_session):
         """
         Test product sorting workflow
         
@@ -121,29 +145,22 @@ class TestE2EWorkflow:
         """
         logger.info("Starting E2E test: Product sorting workflow")
         
-        login_page = LoginPage(driver)
-        products_page = ProductsPage(driver)
-        
-        # Login
-        user = test_users["standard_user"]
-        login_page.navigate()
-        login_page.login(user["username"], user["password"])
+        driver, login_page, dashboard_page, products_page = shopping_session
         
         # Sort by name A-Z
         products_page.sort_products("az")
-        names = products_page.get_all_product_names()
-        assert names == sorted(names), "Products not sorted A-Z"
+        names = [item['name'] for item in products_page.snapshot_inventory()]
+        assert is_sorted(names), "Products not sorted A-Z"
         
         # Sort by price low to high
         products_page.sort_products("lohi")
-        price_strings = products_page.get_all_product_prices()
-        prices = [float(p.replace("$", "")) for p in price_strings]
-        assert prices == sorted(prices), "Products not sorted by price (low to high)"
+        prices = [item['price_value'] for item in products_page.snapshot_inventory()]
+        assert is_sorted(prices), "Products not sorted by price (low to high)"
         
         logger.info("E2E test passed: Product sorting workflow")
     
     @pytest.mark.critical
-    def test_menu_navigation_workflow(self, driver, test_users):
+    def test_menu_navigation_workflow(self, shopping_session):
         """
         Test menu navigation workflow
         
@@ -157,33 +174,26 @@ class TestE2EWorkflow:
         """
         logger.info("Starting E2E test: Menu navigation workflow")
         
-        login_page = LoginPage(driver)
-        dashboard_page = DashboardPage(driver)
-        products_page = ProductsPage(driver)
-        
-        # Login
-        user = test_users["standard_user"]
-        login_page.navigate()
-        login_page.login(user["username"], user["password"])
+        driver, login_page, dashboard_page, products_page = shopping_session
         
         # Add products first
-        products_page.add_first_n_products_to_cart(2)
-        initial_count = dashboard_page.get_cart_item_count()
+        initial_count = products_page.add_first_n_and_count(2)
         assert initial_count == 2, "Products not added"
         
         # Reset app state
         dashboard_page.reset_app_state()
         
-        # Verify cart is cleared (reset removes items)
-        # Note: In actual implementation, you might need to refresh or wait
-        driver.refresh()
-        final_count = dashboard_page.get_cart_item_count()
-        logger.info(f"Cart count after reset: {final_count}")
+        # Verify cart is cleared (the badge updates in place, no reload needed)
+        WebDriverWait(driver, 3).until(
+            lambda d: dashboard_page.get_cart_item_count() == 0,
+            message="Cart not cleared after reset"
+        )
+        logger.info("Cart cleared after reset")
         
         logger.info("E2E test passed: Menu navigation workflow")
     
     @pytest.mark.regression
-    def test_multiple_users_workflow(self, driver, test_users):
+    def test_multiple_users_workflow(self, driver, pages, test_users, session_cookies):
         """
         Test workflow with multiple user types
         
@@ -196,17 +206,12 @@ class TestE2EWorkflow:
         """
         logger.info("Starting E2E test: Multiple users workflow")
         
-        login_page = LoginPage(driver)
-        dashboard_page = DashboardPage(driver)
-        products_page = ProductsPage(driver)
+        login_page = pages.login
+        dashboard_page = pages.dashboard
         
         # User 1: Standard user
         user1 = test_users["standard_user"]
-        login_page.navigate()
-        login_page.login(user1["username"], user1["password"])
-        
-        products_page.add_first_n_products_to_cart(2)
-        assert dashboard_page.get_cart_item_count() == 2
+        assert quick_cart_state(driver, 2, user1, session_cookies) == 2
         
         # Logout
         dashboard_page.logout()
@@ -214,7 +219,8 @@ class TestE2EWorkflow:
         
         # User 2: Performance glitch user
         user2 = test_users["performance_glitch_user"]
-        login_page.login(user2["username"], user2["password"])
+        login_page.login(*user2)
+        assert dashboard_page.is_displayed(), "Dashboard not displayed for performance_glitch_user"
         
         # Verify fresh session (no items in cart)
         cart_count = dashboard_page.get_cart_item_count()
@@ -224,7 +230,7 @@ class TestE2EWorkflow:
     
     @pytest.mark.smoke
     @pytest.mark.critical
-    def test_error_recovery_workflow(self, driver, test_users, invalid_credentials):
+    def test_error_recovery_workflow(self, pages, test_users, invalid_credentials):
         """
         Test error recovery workflow
         
@@ -237,13 +243,13 @@ class TestE2EWorkflow:
         """
         logger.info("Starting E2E test: Error recovery workflow")
         
-        login_page = LoginPage(driver)
-        dashboard_page = DashboardPage(driver)
+        login_page = pages.login
+        dashboard_page = pages.dashboard
         
         # Try invalid login
         invalid = invalid_credentials["invalid_user"]
         login_page.navigate()
-        login_page.login(invalid["username"], invalid["password"])
+        login_page.login(*invalid)
         
         # Verify error
         assert login_page.is_error_displayed(), "Error not displayed"
@@ -253,9 +259,7 @@ class TestE2EWorkflow:
         
         # Login with valid credentials
         valid = test_users["standard_user"]
-        login_page.clear_username()
-        login_page.clear_password()
-        login_page.login(valid["username"], valid["password"])
+        login_page.force_login(*valid)
         
         # Verify success
         assert dashboard_page.is_displayed(), "Dashboard not displayed after valid login"
@@ -263,42 +267,32 @@ class TestE2EWorkflow:
         logger.info("E2E test passed: Error recovery workflow")
     
     @pytest.mark.regression
-    def test_full_shopping_cart_workflow(self, driver, test_users):
+    def test_full_shopping_cart_workflow(self, shopping_session):
         """
         Test adding all products to cart
         
         Steps:
             1. Login
-            2. Get total product count
-            3. Add all products to cart
-            4. Verify all products added
-            5. Navigate to cart
+            2. Add all products to cart, counting them
+            3. Verify all products added
+            4. Navigate to cart
         """
         logger.info("Starting E2E test: Full shopping cart workflow")
         
-        login_page = LoginPage(driver)
-        dashboard_page = DashboardPage(driver)
-        products_page = ProductsPage(driver)
-        
-        # Login
-        user = test_users["standard_user"]
-        login_page.navigate()
-        login_page.login(user["username"], user["password"])
-        
-        # Get product count
-        total_products = products_page.get_product_count()
-        logger.info(f"Total products available: {total_products}")
+        driver, login_page, dashboard_page, products_page = shopping_session
         
-        # Add all products
-        products_page.add_first_n_products_to_cart(total_products)
+        # Add all products and read the cart count
+        total_products, cart_count = products_page.add_all_and_count()
+        logger.info("Total products added: %s", total_products)
         
         # Verify all added
-        cart_count = dashboard_page.get_cart_item_count()
+        assert total_products == products_page.get_product_count(), \
+            f"Added {total_products} products, expected the whole inventory"
         assert cart_count == total_products, \
             f"Expected {total_products} items in cart, got {cart_count}"
         
         # Navigate to cart
         dashboard_page.click_shopping_cart()
-        assert "cart" in driver.current_url
+        assert dashboard_page.wait_for_url_contains("cart"), "Not navigated to cart page"
         
         logger.info("E2E test passed: Full shopping cart workflow")
\ No newline at end of file
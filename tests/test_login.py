@@ -5,16 +5,23 @@ Test cases for login functionality
 
 import pytest
 from pages.login_page import LoginPage
-from pages.products_page import ProductsPage
 from utils.logger import logger
 
 
+@pytest.fixture(scope="class")
+def login_driver(class_driver):
+    """
+    Fixture that shares one browser across tests that never reach a logged-in state
+    """
+    return class_driver
+
+
 @pytest.mark.smoke
 @pytest.mark.critical
 class TestLogin:
     """Test suite for login functionality"""
     
-    def test_successful_login_with_standard_user(self, driver, test_users):
+    def test_successful_login_with_standard_user(self, pages, test_users):
         """
         Test successful login with valid credentials
         
@@ -26,8 +33,8 @@ class TestLogin:
         """
         logger.info("Starting test: Successful login with standard user")
         
-        login_page = LoginPage(driver)
-        products_page = ProductsPage(driver)
+        login_page = pages.login
+        products_page = pages.products
         
         # Get test credentials
         user = test_users["standard_user"]
@@ -36,153 +43,113 @@ class TestLogin:
         login_page.navigate()
         assert login_page.is_displayed(), "Login page is not displayed"
         
-        login_page.login(user["username"], user["password"])
+        login_page.login(*user)
         
         # Verify redirect to products page
-        assert products_page.is_displayed(), "Products page is not displayed after login"
         assert "inventory.html" in products_page.get_current_url(), "URL does not contain inventory"
         
         logger.info("Test passed: User successfully logged in")
     
     @pytest.mark.smoke
-    def test_login_with_locked_out_user(self, driver, test_users):
+    def test_logout_functionality(self, pages, test_users):
         """
-        Test login with locked out user
+        Test logout functionality
         
         Steps:
-            1. Navigate to login page
-            2. Enter locked out user credentials
-            3. Click login button
-            4. Verify error message is displayed
+            1. Login with valid credentials
+            2. Click logout from menu
+            3. Verify user is redirected to login page
         """
-        logger.info("Starting test: Login with locked out user")
+        logger.info("Starting test: Logout functionality")
         
-        login_page = LoginPage(driver)
-        user = test_users["locked_out_user"]
+        login_page = pages.login
+        products_page = pages.products
+        user = test_users["standard_user"]
         
+        # Login
         login_page.navigate()
-        login_page.login(user["username"], user["password"])
-        
-        # Verify error message
-        assert login_page.is_error_displayed(), "Error message is not displayed"
-        error_message = login_page.get_error_message()
-        assert "locked out" in error_message.lower(), f"Unexpected error message: {error_message}"
-        
-        logger.info("Test passed: Correct error displayed for locked out user")
-    
-    @pytest.mark.regression
-    def test_login_with_invalid_username(self, driver, invalid_credentials):
-        """Test login with invalid username"""
-        logger.info("Starting test: Login with invalid username")
+        login_page.login(*user)
+        assert "inventory.html" in products_page.get_current_url(), "Products page not displayed"
         
-        login_page = LoginPage(driver)
-        creds = invalid_credentials["invalid_user"]
-        
-        login_page.navigate()
-        login_page.login(creds["username"], creds["password"])
+        # Logout
+        products_page.logout()
         
-        # Verify error message
-        assert login_page.is_error_displayed(), "Error message is not displayed"
-        error_message = login_page.get_error_message()
-        assert "Username and password do not match" in error_message, \
-            f"Unexpected error message: {error_message}"
+        # Verify redirect to login page
+        current_url = login_page.get_current_url()
+        assert current_url.rstrip("/") == login_page.url.rstrip("/"), \
+            f"Not redirected to login page after logout. URL: {current_url}"
         
-        logger.info("Test passed: Correct error for invalid credentials")
+        logger.info("Test passed: User successfully logged out")
+
+
+@pytest.mark.smoke
+@pytest.mark.critical
+class TestLoginErrors:
+    """Test suite for rejected logins, sharing one browser per class"""
     
-    @pytest.mark.regression
-    def test_login_with_empty_username(self, driver, invalid_credentials):
-        """Test login with empty username"""
-        logger.info("Starting test: Login with empty username")
-        
-        login_page = LoginPage(driver)
-        creds = invalid_credentials["empty_username"]
-        
-        login_page.navigate()
-        login_page.login(creds["username"], creds["password"])
-        
-        # Verify error message
-        assert login_page.is_error_displayed(), "Error message is not displayed"
-        error_message = login_page.get_error_message()
-        assert "Username is required" in error_message, f"Unexpected error message: {error_message}"
-        
-        logger.info("Test passed: Correct error for empty username")
+    @pytest.fixture(autouse=True)
+    def _reset(self, login_driver):
+        """Clear cookies and load a fresh login page before each test"""
+        login_driver.delete_all_cookies()
+        LoginPage(login_driver).navigate()
     
-    @pytest.mark.regression
-    def test_login_with_empty_password(self, driver, invalid_credentials):
-        """Test login with empty password"""
-        logger.info("Starting test: Login with empty password")
+    @pytest.mark.smoke
+    def test_login_with_locked_out_user(self, login_driver, test_users):
+        """
+        Test login with locked out user
+        
+        Steps:
+            1. Start on a fresh login page
+            2. Enter locked out user credentials
+            3. Click login button
+            4. Verify error message is displayed
+        """
+        logger.info("Starting test: Login with locked out user")
         
-        login_page = LoginPage(driver)
-        creds = invalid_credentials["empty_password"]
+        login_page = LoginPage(login_driver)
+        user = test_users["locked_out_user"]
         
-        login_page.navigate()
-        login_page.login(creds["username"], creds["password"])
+        login_page.login(*user)
         
         # Verify error message
         assert login_page.is_error_displayed(), "Error message is not displayed"
         error_message = login_page.get_error_message()
-        assert "Password is required" in error_message, f"Unexpected error message: {error_message}"
+        assert "locked out" in error_message.lower(), f"Unexpected error message: {error_message}"
         
-        logger.info("Test passed: Correct error for empty password")
+        logger.info("Test passed: Correct error displayed for locked out user")
     
     @pytest.mark.regression
-    def test_login_with_empty_credentials(self, driver, invalid_credentials):
-        """Test login with both fields empty"""
-        logger.info("Starting test: Login with empty credentials")
+    @pytest.mark.parametrize("case, expected_error", [
+        ("invalid_user", "Username and password do not match"),
+        ("empty_username", "Username is required"),
+        ("empty_password", "Password is required"),
+        ("empty_both", "Username is required"),
+    ])
+    def test_login_errors(self, login_driver, invalid_credentials, case, expected_error):
+        """Test that each invalid credential case shows the expected error"""
+        logger.info("Starting test: Login error for %s", case)
         
-        login_page = LoginPage(driver)
-        creds = invalid_credentials["empty_both"]
+        login_page = LoginPage(login_driver)
+        creds = invalid_credentials[case]
         
-        login_page.navigate()
-        login_page.login(creds["username"], creds["password"])
+        login_page.login(*creds)
         
         # Verify error message
         assert login_page.is_error_displayed(), "Error message is not displayed"
         error_message = login_page.get_error_message()
-        assert "Username is required" in error_message, f"Unexpected error message: {error_message}"
-        
-        logger.info("Test passed: Correct error for empty credentials")
-    
-    @pytest.mark.smoke
-    def test_logout_functionality(self, driver, test_users):
-        """
-        Test logout functionality
-        
-        Steps:
-            1. Login with valid credentials
-            2. Click logout from menu
-            3. Verify user is redirected to login page
-        """
-        logger.info("Starting test: Logout functionality")
-        
-        login_page = LoginPage(driver)
-        products_page = ProductsPage(driver)
-        user = test_users["standard_user"]
-        
-        # Login
-        login_page.navigate()
-        login_page.login(user["username"], user["password"])
-        assert products_page.is_displayed(), "Products page not displayed"
+        assert expected_error in error_message, f"Unexpected error message: {error_message}"
         
-        # Logout
-        products_page.logout()
-        
-        # Verify redirect to login page
-        assert login_page.is_displayed(), "Login page is not displayed after logout"
-        assert "saucedemo.com" in login_page.get_current_url(), "URL incorrect after logout"
-        
-        logger.info("Test passed: User successfully logged out")
+        logger.info("Test passed: Correct error for %s", case)
     
     @pytest.mark.regression
-    def test_error_message_can_be_closed(self, driver, invalid_credentials):
+    def test_error_message_can_be_closed(self, login_driver, invalid_credentials):
         """Test that error message can be closed"""
         logger.info("Starting test: Error message can be closed")
         
-        login_page = LoginPage(driver)
+        login_page = LoginPage(login_driver)
         creds = invalid_credentials["invalid_user"]
         
-        login_page.navigate()
-        login_page.login(creds["username"], creds["password"])
+        login_page.login(*creds)
         
         # Verify error is displayed
         assert login_page.is_error_displayed(), "Error message is not displayed"
@@ -193,4 +160,4 @@ class TestLogin:
         # Verify error is no longer displayed
         assert not login_page.is_error_displayed(), "Error message still displayed after closing"
         
-        logger.info("Test passed: Error message can be closed")
\ No newline at end of file
+        logger.info("Test passed: Error message can be closed")
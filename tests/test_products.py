@@ -5,22 +5,33 @@ Test cases for products/inventory page functionality
 
 import pytest
 from pages.login_page import LoginPage
+from pages.dashboard_page import DashboardPage
 from pages.products_page import ProductsPage
 from utils.logger import logger
+from utils.sorting import is_sorted
 
 
-@pytest.fixture(scope="function")
-def logged_in_driver(driver, test_users):
+@pytest.fixture(scope="class")
+def logged_in_driver(class_driver, test_users, session_cookies):
     """
     Fixture that provides a driver with user already logged in
+    
+    Logs in once per test class; _reset_cart restores a clean products
+    page before each test instead of logging in again.
     """
-    login_page = LoginPage(driver)
+    login_page = LoginPage(class_driver)
     user = test_users["standard_user"]
     
-    login_page.navigate()
-    login_page.login(user["username"], user["password"])
+    login_page.login_with_session(*user, session_cookies)
     
-    return driver
+    return class_driver
+
+
+@pytest.fixture(autouse=True)
+def _reset_cart(logged_in_driver):
+    """Empty the cart and reload the products page before each test"""
+    DashboardPage(logged_in_driver).reset_app_state()
+    ProductsPage(logged_in_driver).navigate()
 
 
 @pytest.mark.regression
@@ -48,7 +59,7 @@ class TestProducts:
         # Verify products are displayed
         product_count = products_page.get_product_count()
         assert product_count > 0, "No products are displayed"
-        logger.info(f"Found {product_count} products on the page")
+        logger.info("Found %s products on the page", product_count)
         
         logger.info("Test passed: Products page displays correctly")
     
@@ -66,16 +77,12 @@ class TestProducts:
         
         products_page = ProductsPage(logged_in_driver)
         
-        # Get initial cart count
-        initial_count = products_page.get_cart_item_count()
-        
-        # Add product to cart
+        # Add product to cart (_reset_cart guarantees it starts empty)
         products_page.add_product_to_cart_by_name("sauce-labs-backpack")
         
-        # Verify cart count increased
+        # Verify cart count
         current_count = products_page.get_cart_item_count()
-        assert current_count == initial_count + 1, \
-            f"Cart count incorrect. Expected {initial_count + 1}, got {current_count}"
+        assert current_count == 1, f"Cart count incorrect. Expected 1, got {current_count}"
         
         logger.info("Test passed: Product successfully added to cart")
     
@@ -86,11 +93,10 @@ class TestProducts:
         
         products_page = ProductsPage(logged_in_driver)
         
-        # Add 3 products to cart
-        products_page.add_first_n_products_to_cart(3)
+        # Add 3 products to cart and read the cart count
+        cart_count = products_page.add_first_n_and_count(3)
         
         # Verify cart count
-        cart_count = products_page.get_cart_item_count()
         assert cart_count == 3, f"Cart count incorrect. Expected 3, got {cart_count}"
         
         logger.info("Test passed: Multiple products added to cart")
@@ -139,7 +145,7 @@ class TestProducts:
         for name in product_names:
             assert name and name.strip(), f"Product name is empty or invalid: '{name}'"
         
-        logger.info(f"Test passed: Found {len(product_names)} product names")
+        logger.info("Test passed: Found %s product names", len(product_names))
     
     @pytest.mark.regression
     def test_product_prices_displayed(self, logged_in_driver):
@@ -148,19 +154,19 @@ class TestProducts:
         
         products_page = ProductsPage(logged_in_driver)
         
-        # Get all product prices
-        prices = products_page.get_all_product_prices()
+        # Get displayed and parsed prices together
+        products = products_page.snapshot_inventory()
         
         # Verify prices are not empty and contain $
-        assert len(prices) > 0, "No product prices found"
+        assert len(products) > 0, "No product prices found"
         
-        for price in prices:
+        for product in products:
+            price = product['price']
             assert "$" in price, f"Price doesn't contain $ symbol: {price}"
-            # Extract numeric value and verify it's valid
-            price_value = price.replace("$", "").strip()
-            assert float(price_value) > 0, f"Invalid price value: {price}"
+            # Verify the numeric value is valid
+            assert (product['price_value'] or 0) > 0, f"Invalid price value: {price}"
         
-        logger.info(f"Test passed: All {len(prices)} prices are valid")
+        logger.info("Test passed: All %s prices are valid", len(products))
     
     @pytest.mark.regression
     def test_sort_products_by_name_ascending(self, logged_in_driver):
@@ -173,11 +179,10 @@ class TestProducts:
         products_page.sort_products("az")
         
         # Get product names
-        product_names = products_page.get_all_product_names()
+        product_names = [item['name'] for item in products_page.snapshot_inventory()]
         
         # Verify names are in ascending order
-        sorted_names = sorted(product_names)
-        assert product_names == sorted_names, "Products are not sorted in ascending order"
+        assert is_sorted(product_names), "Products are not sorted in ascending order"
         
         logger.info("Test passed: Products sorted by name (A-Z)")
     
@@ -192,11 +197,10 @@ class TestProducts:
         products_page.sort_products("za")
         
         # Get product names
-        product_names = products_page.get_all_product_names()
+        product_names = [item['name'] for item in products_page.snapshot_inventory()]
         
         # Verify names are in descending order
-        sorted_names = sorted(product_names, reverse=True)
-        assert product_names == sorted_names, "Products are not sorted in descending order"
+        assert is_sorted(product_names, reverse=True), "Products are not sorted in descending order"
         
         logger.info("Test passed: Products sorted by name (Z-A)")
     
@@ -211,12 +215,10 @@ class TestProducts:
         products_page.sort_products("lohi")
         
         # Get product prices
-        price_strings = products_page.get_all_product_prices()
-        prices = [float(p.replace("$", "").strip()) for p in price_strings]
+        prices = [item['price_value'] for item in products_page.snapshot_inventory()]
         
         # Verify prices are in ascending order
-        sorted_prices = sorted(prices)
-        assert prices == sorted_prices, "Products are not sorted by price (low to high)"
+        assert is_sorted(prices), "Products are not sorted by price (low to high)"
         
         logger.info("Test passed: Products sorted by price (low to high)")
     
@@ -231,7 +233,7 @@ class TestProducts:
         products_page.click_shopping_cart()
         
         # Verify navigation to cart page
-        current_url = products_page.get_current_url()
-        assert "cart.html" in current_url, f"Not navigated to cart page. URL: {current_url}"
+        assert products_page.wait_for_url_contains("cart.html"), \
+            f"Not navigated to cart page. URL: {products_page.get_current_url()}"
         
         logger.info("Test passed: Successfully navigated to cart page")
\ No newline at end of file
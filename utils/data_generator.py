@@ -4,25 +4,307 @@ Generates random test data for various testing scenarios
 """
 
 from faker import Faker
+import itertools
+import os
 import random
 import string
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List
+from functools import cached_property
+from typing import ClassVar, Dict, List, Optional, Tuple
 from utils.logger import logger
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Character sets for the random string fields
+_SPECIAL_CHARS = "!@#$%^&*"
+_SKU_ALPHABET = string.ascii_uppercase + string.digits
+
+# List sizes from which generate_user_list / generate_product_list fan out to worker processes
+_PARALLEL_THRESHOLD = 500
+
+# Words and domains for the template-filled email/URL fields
+_WORDS = (
+    'alpha', 'bravo', 'cedar', 'delta', 'ember', 'falcon', 'garnet', 'harbor',
+    'indigo', 'juniper', 'kestrel', 'lumen', 'maple', 'nova', 'orbit', 'pixel',
+    'quartz', 'raven', 'sierra', 'tango', 'umber', 'vector', 'willow', 'zephyr',
+)
+_EMAIL_DOMAINS = ('example.com', 'example.org', 'example.net')
+_URL_TLDS = ('com', 'org', 'net', 'io')
+
+# Faker providers loaded by each generator group (a group may use formatters from another)
+_PERSON_PROVIDERS = (
+    'faker.providers.person',
+    'faker.providers.internet',
+    'faker.providers.phone_number',
+    'faker.providers.date_time',
+)
+_ADDRESS_PROVIDERS = ('faker.providers.address', 'faker.providers.person')
+_PAYMENT_PROVIDERS = ('faker.providers.credit_card', 'faker.providers.person')
+_COMPANY_PROVIDERS = (
+    'faker.providers.company',
+    'faker.providers.person',
+    'faker.providers.internet',
+    'faker.providers.phone_number',
+)
+_TEXT_PROVIDERS = ('faker.providers.lorem',)
+_DATE_PROVIDERS = ('faker.providers.date_time',)
+
+# Password alphabets keyed by (include_uppercase, include_numbers, include_special), built on first use
+_ALPHABET_CACHE = {}
+
+
+# Choice lists for company and product records
+_INDUSTRIES = ('Technology', 'Finance', 'Healthcare', 'Retail', 'Manufacturing')
+_CATEGORIES = ('Electronics', 'Clothing', 'Books', 'Home', 'Sports')
+
+# Record schemas as (key, expression) pairs, compiled into factories by _compile_factory.
+# Expressions may use the factory's parameters and the names in _FACTORY_GLOBALS.
+_USER_SCHEMA = (
+    ('first_name', "fake.first_name()"),
+    ('last_name', "fake.last_name()"),
+    ('email', "fake.email()"),
+    ('username', "fake.user_name()"),
+    ('password', "password"),
+    ('phone', "fake.phone_number()"),
+    ('date_of_birth', "fake.date_of_birth(minimum_age=18, maximum_age=80).strftime('%Y-%m-%d')"),
+)
+_ADDRESS_SCHEMA = (
+    ('street_address', "fake.street_address()"),
+    ('city', "fake.city()"),
+    ('state', "fake.state()"),
+    ('zip_code', "fake.zipcode()"),
+    ('country', "fake.country()"),
+)
+_COMPANY_SCHEMA = (
+    ('name', "fake.company()"),
+    ('email', "fake.company_email()"),
+    ('phone', "fake.phone_number()"),
+    ('website', "fake.url()"),
+    ('industry', "rng.choice(_INDUSTRIES)"),
+)
+_PRODUCT_SCHEMA = (
+    ('name', "fake.word().capitalize() + ' ' + fake.word().capitalize()"),
+    ('description', "fake.text(max_nb_chars=200)"),
+    ('price', "round(rng.uniform(10.0, 999.99), 2)"),
+    ('sku', "''.join(rng.choices(_SKU_ALPHABET, k=8))"),
+    ('category', "rng.choice(_CATEGORIES)"),
+    ('quantity', "rng.randint(1, 100)"),
+)
+_FACTORY_GLOBALS = {
+    '_INDUSTRIES': _INDUSTRIES,
+    '_CATEGORIES': _CATEGORIES,
+    '_SKU_ALPHABET': _SKU_ALPHABET,
+}
+
+
+def _compile_factory(name: str, params: str, schema: Tuple[Tuple[str, str], ...]):
+    """
+    Generate and compile a function that builds one record as a dict literal
+    
+    The generated body only reads its parameters (fast locals) and the module
+    constants in _FACTORY_GLOBALS, avoiding per-field attribute lookups on self.
+    
+    Args:
+        name: Function name
+        params: Parameter list source, e.g. "fake, rng"
+        schema: (key, expression) pairs
+    
+    Returns:
+        Compiled function
+    """
+    fields = ''.join(f"        {key!r}: {expression},\n" for key, expression in schema)
+    source = f"def {name}({params}):\n    return {{\n{fields}    }}\n"
+    namespace = dict(_FACTORY_GLOBALS)
+    exec(compile(source, f"<{name}>", 'exec'), namespace)
+    return namespace[name]
+
+
+_gen_user = _compile_factory('_gen_user', 'fake, password', _USER_SCHEMA)
+_gen_address = _compile_factory('_gen_address', 'fake', _ADDRESS_SCHEMA)
+_gen_company = _compile_factory('_gen_company', 'fake, rng', _COMPANY_SCHEMA)
+_gen_product = _compile_factory('_gen_product', 'fake, rng', _PRODUCT_SCHEMA)
+
+# Process-wide sequence for unique emails/usernames (next() on a count is atomic under the GIL)
+_uid_counter = itertools.count()
+_B36_DIGITS = string.digits + string.ascii_lowercase
+
+
+def _b36(n: int) -> str:
+    """Encode a non-negative integer in base 36"""
+    if n == 0:
+        return '0'
+    digits = []
+    while n:
+        n, remainder = divmod(n, 36)
+        digits.append(_B36_DIGITS[remainder])
+    return ''.join(reversed(digits))
+
+
+def _unique_suffix() -> str:
+    """Timestamp plus sequence number, unique within the process even in the same nanosecond"""
+    return f"{_b36(time.time_ns())}_{_b36(next(_uid_counter))}"
+
+
+# Per-thread random generators; see _rng
+_tls = threading.local()
+
+
+def _rng() -> random.Random:
+    """
+    Get the calling thread's random generator, creating it on first use
+    
+    Each thread draws from its own urandom-seeded Random instead of the module-level
+    generator, so outputs are not reproducible unless _tls.rng is replaced with a
+    seeded Random.
+    
+    Returns:
+        random.Random instance for the current thread
+    """
+    rng = getattr(_tls, 'rng', None)
+    if rng is None:
+        rng = random.Random(os.urandom(8))
+        _tls.rng = rng
+    return rng
+
+
+def _np_rng():
+    """Get the calling thread's numpy Generator (numpy must be installed)"""
+    np_rng = getattr(_tls, 'np_rng', None)
+    if np_rng is None:
+        np_rng = np.random.default_rng()
+        _tls.np_rng = np_rng
+    return np_rng
+
+
+def _password_alphabet(include_uppercase: bool, include_numbers: bool, include_special: bool) -> str:
+    """Get the password alphabet for a combination of character classes"""
+    key = (include_uppercase, include_numbers, include_special)
+    alphabet = _ALPHABET_CACHE.get(key)
+    if alphabet is None:
+        alphabet = string.ascii_lowercase
+        if include_uppercase:
+            alphabet += string.ascii_uppercase
+        if include_numbers:
+            alphabet += string.digits
+        if include_special:
+            alphabet += _SPECIAL_CHARS
+        _ALPHABET_CACHE[key] = alphabet
+    return alphabet
+
+
+def _seed_worker():
+    """Give each worker process its own generator and Faker seed so chunks don't repeat"""
+    seed = os.getpid() + time.time_ns()
+    _tls.rng = random.Random(seed)
+    if np is not None:
+        _tls.np_rng = np.random.default_rng(seed)
+    Faker.seed(seed)
+
+
+def _gen_user_chunk(n: int, locale: str) -> List[Dict[str, str]]:
+    """Generate n users in a worker process"""
+    return DataGenerator(locale)._generate_users(n)
+
+
+def _gen_product_chunk(n: int, locale: str) -> List[Dict[str, any]]:
+    """Generate n products in a worker process"""
+    return DataGenerator(locale)._generate_products(n)
+
+
+def _chunk_sizes(count: int, workers: int) -> List[int]:
+    """Split count into chunks of about count // (4 * workers) items"""
+    size = max(1, count // (4 * workers))
+    sizes = [size] * (count // size)
+    if count % size:
+        sizes.append(count % size)
+    return sizes
+
 
 class DataGenerator:
     """Generate random test data"""
     
+    # Faker instances shared by every generator with the same (locale, providers)
+    _FAKER_CACHE: ClassVar[Dict[Tuple[str, Optional[Tuple[str, ...]]], Faker]] = {}
+    _faker_lock: ClassVar[threading.Lock] = threading.Lock()
+    
     def __init__(self, locale: str = 'en_US'):
         """
         Initialize data generator
         
+        Fakers are built on first use, loading only the providers each generator needs.
+        
         Args:
             locale: Locale for faker library
         """
-        self.fake = Faker(locale)
-        logger.debug(f"DataGenerator initialized with locale: {locale}")
+        self._locale = locale
+        logger.debug("DataGenerator initialized with locale: %s", locale)
+    
+    @classmethod
+    def _get_faker(cls, locale: str, providers: Tuple[str, ...] = None) -> Faker:
+        """
+        Get the shared Faker for a locale and provider set, building it only once
+        
+        Args:
+            locale: Locale for faker library
+            providers: Provider module paths to load (None loads every provider)
+        
+        Returns:
+            Faker instance
+        """
+        key = (locale, providers)
+        fake = cls._FAKER_CACHE.get(key)
+        if fake is None:
+            with cls._faker_lock:
+                fake = cls._FAKER_CACHE.get(key)
+                if fake is None:
+                    if providers is None:
+                        fake = Faker(locale)
+                    else:
+                        fake = Faker(locale, providers=list(providers))
+                    cls._FAKER_CACHE[key] = fake
+        return fake
+    
+    @cached_property
+    def fake(self) -> Faker:
+        """Faker with every provider loaded, for callers that need formatters not covered below"""
+        return self._get_faker(self._locale)
+    
+    @cached_property
+    def _person_fake(self) -> Faker:
+        """Faker with person, internet, phone and date providers"""
+        return self._get_faker(self._locale, _PERSON_PROVIDERS)
+    
+    @cached_property
+    def _address_fake(self) -> Faker:
+        """Faker with address providers"""
+        return self._get_faker(self._locale, _ADDRESS_PROVIDERS)
+    
+    @cached_property
+    def _payment_fake(self) -> Faker:
+        """Faker with credit card providers"""
+        return self._get_faker(self._locale, _PAYMENT_PROVIDERS)
+    
+    @cached_property
+    def _company_fake(self) -> Faker:
+        """Faker with company, internet and phone providers"""
+        return self._get_faker(self._locale, _COMPANY_PROVIDERS)
+    
+    @cached_property
+    def _text_fake(self) -> Faker:
+        """Faker with lorem providers"""
+        return self._get_faker(self._locale, _TEXT_PROVIDERS)
+    
+    @cached_property
+    def _date_fake(self) -> Faker:
+        """Faker with date/time providers"""
+        return self._get_faker(self._locale, _DATE_PROVIDERS)
     
     # User Data Generation
     
@@ -33,16 +315,8 @@ class DataGenerator:
         Returns:
             Dictionary with user information
         """
-        user = {
-            'first_name': self.fake.first_name(),
-            'last_name': self.fake.last_name(),
-            'email': self.fake.email(),
-            'username': self.fake.user_name(),
-            'password': self.generate_password(),
-            'phone': self.fake.phone_number(),
-            'date_of_birth': self.fake.date_of_birth(minimum_age=18, maximum_age=80).strftime('%Y-%m-%d')
-        }
-        logger.debug(f"Generated user: {user['username']}")
+        user = _gen_user(self._person_fake, self.generate_password())
+        logger.debug("Generated user: %s", user['username'])
         return user
     
     def generate_password(self, length: int = 12, 
@@ -61,31 +335,31 @@ class DataGenerator:
         Returns:
             Generated password
         """
-        characters = string.ascii_lowercase
-        
-        if include_uppercase:
-            characters += string.ascii_uppercase
-        if include_numbers:
-            characters += string.digits
-        if include_special:
-            characters += "!@#$%^&*"
-        
-        password = ''.join(random.choice(characters) for _ in range(length))
-        return password
+        alphabet = _password_alphabet(include_uppercase, include_numbers, include_special)
+        return ''.join(_rng().choices(alphabet, k=length))
     
-    def generate_email(self, domain: str = None) -> str:
+    def generate_email(self, domain: str = None, realistic: bool = False) -> str:
         """
         Generate random email address
         
         Args:
             domain: Email domain (optional)
+            realistic: Use Faker for a name-like local part instead of the word template
         
         Returns:
             Email address
         """
+        if realistic:
+            return self._generate_email_fake(domain)
+        rng = _rng()
+        domain = domain or rng.choice(_EMAIL_DOMAINS)
+        return f"{rng.choice(_WORDS)}{rng.randint(1, 9999)}@{domain}"
+    
+    def _generate_email_fake(self, domain: str = None) -> str:
+        """Generate a Faker-backed email address"""
         if domain:
-            return f"{self.fake.user_name()}@{domain}"
-        return self.fake.email()
+            return f"{self._person_fake.user_name()}@{domain}"
+        return self._person_fake.email()
     
     # Address Data Generation
     
@@ -96,14 +370,8 @@ class DataGenerator:
         Returns:
             Dictionary with address information
         """
-        address = {
-            'street_address': self.fake.street_address(),
-            'city': self.fake.city(),
-            'state': self.fake.state(),
-            'zip_code': self.fake.zipcode(),
-            'country': self.fake.country()
-        }
-        logger.debug(f"Generated address in: {address['city']}")
+        address = _gen_address(self._address_fake)
+        logger.debug("Generated address in: %s", address['city'])
         return address
     
     # Payment Data Generation
@@ -116,14 +384,14 @@ class DataGenerator:
             Dictionary with credit card information
         """
         card = {
-            'card_number': self.fake.credit_card_number(),
-            'card_type': self.fake.credit_card_provider(),
-            'cvv': ''.join(random.choices(string.digits, k=3)),
-            'expiry_month': random.randint(1, 12),
-            'expiry_year': random.randint(2024, 2030),
-            'cardholder_name': self.fake.name()
+            'card_number': self._payment_fake.credit_card_number(),
+            'card_type': self._payment_fake.credit_card_provider(),
+            'cvv': f"{_rng().randrange(1000):03d}",
+            'expiry_month': _rng().randint(1, 12),
+            'expiry_year': _rng().randint(2024, 2030),
+            'cardholder_name': self._payment_fake.name()
         }
-        logger.debug(f"Generated {card['card_type']} card")
+        logger.debug("Generated %s card", card['card_type'])
         return card
     
     # Company Data Generation
@@ -135,14 +403,8 @@ class DataGenerator:
         Returns:
             Dictionary with company information
         """
-        company = {
-            'name': self.fake.company(),
-            'email': self.fake.company_email(),
-            'phone': self.fake.phone_number(),
-            'website': self.fake.url(),
-            'industry': random.choice(['Technology', 'Finance', 'Healthcare', 'Retail', 'Manufacturing'])
-        }
-        logger.debug(f"Generated company: {company['name']}")
+        company = _gen_company(self._company_fake, _rng())
+        logger.debug("Generated company: %s", company['name'])
         return company
     
     # Product Data Generation
@@ -154,15 +416,8 @@ class DataGenerator:
         Returns:
             Dictionary with product information
         """
-        product = {
-            'name': f"{self.fake.word().capitalize()} {self.fake.word().capitalize()}",
-            'description': self.fake.text(max_nb_chars=200),
-            'price': round(random.uniform(10.0, 999.99), 2),
-            'sku': ''.join(random.choices(string.ascii_uppercase + string.digits, k=8)),
-            'category': random.choice(['Electronics', 'Clothing', 'Books', 'Home', 'Sports']),
-            'quantity': random.randint(1, 100)
-        }
-        logger.debug(f"Generated product: {product['name']}")
+        product = _gen_product(self._text_fake, _rng())
+        logger.debug("Generated product: %s", product['name'])
         return product
     
     # Text Data Generation
@@ -177,15 +432,15 @@ class DataGenerator:
         Returns:
             Generated text
         """
-        return self.fake.text(max_nb_chars=sentences * 50)
+        return self._text_fake.text(max_nb_chars=sentences * 50)
     
     def generate_sentence(self) -> str:
         """Generate random sentence"""
-        return self.fake.sentence()
+        return self._text_fake.sentence()
     
     def generate_paragraph(self) -> str:
         """Generate random paragraph"""
-        return self.fake.paragraph()
+        return self._text_fake.paragraph()
     
     # Date/Time Generation
     
@@ -200,7 +455,7 @@ class DataGenerator:
         Returns:
             Date string (YYYY-MM-DD)
         """
-        date = self.fake.date_between(start_date=start_date, end_date=end_date)
+        date = self._date_fake.date_between(start_date=start_date, end_date=end_date)
         return date.strftime('%Y-%m-%d')
     
     def generate_future_date(self, days: int = 30) -> str:
@@ -233,13 +488,55 @@ class DataGenerator:
     
     def generate_random_number(self, min_value: int = 1, max_value: int = 100) -> int:
         """Generate random integer"""
-        return random.randint(min_value, max_value)
+        return _rng().randint(min_value, max_value)
     
     def generate_random_float(self, min_value: float = 1.0, 
                              max_value: float = 100.0, 
                              decimals: int = 2) -> float:
         """Generate random float"""
-        return round(random.uniform(min_value, max_value), decimals)
+        return round(_rng().uniform(min_value, max_value), decimals)
+    
+    def generate_random_numbers(self, count: int, min_value: int = 1, max_value: int = 100) -> List[int]:
+        """
+        Generate a batch of random integers
+        
+        Uses numpy's vectorized generator when numpy is installed.
+        
+        Args:
+            count: Number of values
+            min_value: Smallest value (inclusive)
+            max_value: Largest value (inclusive)
+        
+        Returns:
+            List of integers
+        """
+        if np is not None:
+            return _np_rng().integers(min_value, max_value + 1, size=count).tolist()
+        rng = _rng()
+        return [rng.randint(min_value, max_value) for _ in range(count)]
+    
+    def generate_random_floats(self, count: int,
+                               min_value: float = 1.0,
+                               max_value: float = 100.0,
+                               decimals: int = 2) -> List[float]:
+        """
+        Generate a batch of random floats
+        
+        Uses numpy's vectorized generator when numpy is installed.
+        
+        Args:
+            count: Number of values
+            min_value: Lower bound
+            max_value: Upper bound
+            decimals: Decimal places to round to
+        
+        Returns:
+            List of floats
+        """
+        if np is not None:
+            return np.round(_np_rng().uniform(min_value, max_value, size=count), decimals).tolist()
+        rng = _rng()
+        return [round(rng.uniform(min_value, max_value), decimals) for _ in range(count)]
     
     # List Generation
     
@@ -247,31 +544,92 @@ class DataGenerator:
         """
         Generate list of users
         
+        Lists of _PARALLEL_THRESHOLD users or more are split across worker processes.
+        
         Args:
             count: Number of users to generate
         
         Returns:
             List of user dictionaries
         """
-        return [self.generate_user() for _ in range(count)]
+        if count < _PARALLEL_THRESHOLD:
+            users = self._generate_users(count)
+        else:
+            users = self._generate_in_workers(_gen_user_chunk, count)
+        logger.debug("Generated %s users", count)
+        return users
     
     def generate_product_list(self, count: int = 5) -> List[Dict[str, any]]:
         """
         Generate list of products
         
+        Lists of _PARALLEL_THRESHOLD products or more are split across worker processes.
+        
         Args:
             count: Number of products to generate
         
         Returns:
             List of product dictionaries
         """
-        return [self.generate_product() for _ in range(count)]
+        if count < _PARALLEL_THRESHOLD:
+            products = self._generate_products(count)
+        else:
+            products = self._generate_in_workers(_gen_product_chunk, count)
+        logger.debug("Generated %s products", count)
+        return products
+    
+    def _generate_in_workers(self, chunk_fn, count: int) -> List[Dict[str, any]]:
+        """
+        Generate count records across a process pool, one chunk per task
+        
+        Args:
+            chunk_fn: Module-level chunk generator taking (n, locale)
+            count: Number of records to generate
+        
+        Returns:
+            Concatenated list of records
+        """
+        workers = os.cpu_count() or 1
+        sizes = _chunk_sizes(count, workers)
+        records = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_seed_worker) as executor:
+            for chunk in executor.map(chunk_fn, sizes, [self._locale] * len(sizes)):
+                records.extend(chunk)
+        return records
+    
+    def _generate_users(self, count: int) -> List[Dict[str, str]]:
+        """
+        Generate users from _USER_SCHEMA, the same factory generate_user uses
+        
+        Args:
+            count: Number of users to generate
+        
+        Returns:
+            List of user dictionaries
+        """
+        fake = self._person_fake
+        passwords = [self.generate_password() for _ in range(count)]
+        return [_gen_user(fake, password) for password in passwords]
+    
+    def _generate_products(self, count: int) -> List[Dict[str, any]]:
+        """
+        Generate products from _PRODUCT_SCHEMA, the same factory generate_product uses
+        
+        Args:
+            count: Number of products to generate
+        
+        Returns:
+            List of product dictionaries
+        """
+        fake = self._text_fake
+        rng = _rng()
+        return [_gen_product(fake, rng) for _ in range(count)]
     
     # Unique Data Generation
     
     def generate_unique_email(self, prefix: str = "test") -> str:
         """
-        Generate unique email with timestamp
+        Generate unique email with a base36 timestamp and sequence number
         
         Args:
             prefix: Email prefix
@@ -279,12 +637,11 @@ class DataGenerator:
         Returns:
             Unique email address
         """
-        timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
-        return f"{prefix}_{timestamp}@test.com"
+        return f"{prefix}_{_unique_suffix()}@test.com"
     
     def generate_unique_username(self, prefix: str = "user") -> str:
         """
-        Generate unique username with timestamp
+        Generate unique username with a base36 timestamp and sequence number
         
         Args:
             prefix: Username prefix
@@ -292,8 +649,7 @@ class DataGenerator:
         Returns:
             Unique username
         """
-        timestamp = datetime.now().strftime('%Y%m%d%H%M%S')
-        return f"{prefix}_{timestamp}"
+        return f"{prefix}_{_unique_suffix()}"
     
     # Phone Number Generation
     
@@ -307,14 +663,25 @@ class DataGenerator:
         Returns:
             Phone number string
         """
-        number = ''.join(random.choices(string.digits, k=10))
+        number = f"{_rng().randrange(10 ** 10):010d}"
         return f"{country_code} ({number[:3]}) {number[3:6]}-{number[6:]}"
     
     # URL Generation
     
-    def generate_url(self) -> str:
-        """Generate random URL"""
-        return self.fake.url()
+    def generate_url(self, realistic: bool = False) -> str:
+        """
+        Generate random URL
+        
+        Args:
+            realistic: Use Faker for a company-like domain instead of the word template
+        
+        Returns:
+            URL string
+        """
+        if realistic:
+            return self._company_fake.url()
+        rng = _rng()
+        return f"https://www.{rng.choice(_WORDS)}{rng.randint(1, 999)}.{rng.choice(_URL_TLDS)}/"
     
     def generate_image_url(self, width: int = 640, height: int = 480) -> str:
         """
@@ -341,7 +708,7 @@ class DataGenerator:
         Returns:
             Filename string
         """
-        name = ''.join(random.choices(string.ascii_lowercase, k=10))
+        name = ''.join(_rng().choices(string.ascii_lowercase, k=10))
         return f"{name}.{extension}"
 
 
@@ -0,0 +1,36 @@
+"""
+Flows Utility
+Shortcuts that bring the application to a known state in as few WebDriver calls as possible
+"""
+
+from selenium.webdriver.remote.webdriver import WebDriver
+from pages.login_page import LoginPage
+from pages.products_page import ProductsPage
+from utils.logger import logger
+
+
+def quick_cart_state(driver: WebDriver, n_products: int, credentials, cookie_cache: dict) -> int:
+    """
+    Log in and add the first N products to the cart, returning the cart count
+    
+    The login restores cached session cookies when available (see
+    LoginPage.login_with_session), and the products are added and counted
+    in a single script call.
+    
+    Args:
+        driver: WebDriver instance
+        n_products: Number of products to add (None adds all)
+        credentials: (username, password) pair, e.g. a Credentials tuple
+        cookie_cache: Dict of username -> cookies shared across calls
+    
+    Returns:
+        Number of items in cart badge
+    """
+    username, password = credentials
+    logger.info("Preparing cart state: %s products for %s", n_products, username)
+    LoginPage(driver).login_with_session(username, password, cookie_cache)
+    
+    products_page = ProductsPage(driver)
+    if n_products is None:
+        return products_page.add_all_and_count()[1]
+    return products_page.add_first_n_and_count(n_products)
@@ -3,11 +3,52 @@ Logger Utility
 Provides colorized console and file logging for the framework
 """
 
+import atexit
 import logging
+import logging.handlers
+import os
+import queue
 import sys
 from pathlib import Path
 from datetime import datetime
-import colorlog
+
+
+# ANSI color prefix per log level and the code that resets it
+_RESET = '\x1b[0m'
+_PREFIX = {
+    logging.DEBUG: '\x1b[36m',
+    logging.INFO: '\x1b[32m',
+    logging.WARNING: '\x1b[33m',
+    logging.ERROR: '\x1b[31m',
+    logging.CRITICAL: '\x1b[31m\x1b[47m',
+}
+
+
+def _default_level() -> str:
+    """LOG_LEVEL if set, else WARNING in CI (quieter, fewer disk writes) and DEBUG locally"""
+    return os.getenv('LOG_LEVEL') or ('WARNING' if os.getenv('CI') else 'DEBUG')
+
+
+class _ColorFormatter(logging.Formatter):
+    """Formatter that wraps the record header in its level's pre-baked ANSI color"""
+    
+    def __init__(self, header: str, datefmt: str = None, use_color: bool = True):
+        """
+        Initialize formatter
+        
+        Args:
+            header: Format for the colored part before the message
+            datefmt: Date format for asctime
+            use_color: Emit ANSI codes (disable for non-terminal streams)
+        """
+        reset = _RESET if use_color else ''
+        super().__init__(f'{header}{reset} %(message)s{reset}', datefmt=datefmt)
+        self._use_color = use_color
+    
+    def format(self, record: logging.LogRecord) -> str:
+        if not self._use_color:
+            return super().format(record)
+        return _PREFIX.get(record.levelno, '') + super().format(record)
 
 
 class Logger:
@@ -16,7 +57,7 @@ class Logger:
     def __init__(self, name: str = 'SeleniumFramework'):
         self.name = name
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(logging.DEBUG)
+        self.logger.setLevel(_default_level().upper())
         
         # Prevent duplicate handlers
         if not self.logger.handlers:
@@ -25,26 +66,20 @@ class Logger:
     
     def _setup_console_handler(self):
         """Setup colorized console handler"""
-        console_handler = colorlog.StreamHandler(sys.stdout)
+        console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.INFO)
         
-        console_format = colorlog.ColoredFormatter(
-            '%(log_color)s%(asctime)s [%(levelname)-8s] [%(filename)s:%(lineno)d]%(reset)s %(message)s',
+        console_format = _ColorFormatter(
+            '%(asctime)s [%(levelname)-8s] [%(filename)s:%(lineno)d]',
             datefmt='%Y-%m-%d %H:%M:%S',
-            log_colors={
-                'DEBUG': 'cyan',
-                'INFO': 'green',
-                'WARNING': 'yellow',
-                'ERROR': 'red',
-                'CRITICAL': 'red,bg_white',
-            }
+            use_color=sys.stdout.isatty()
         )
         
         console_handler.setFormatter(console_format)
         self.logger.addHandler(console_handler)
     
     def _setup_file_handler(self):
-        """Setup file handler"""
+        """Setup file handler, fed through a queue so writes happen off the logging thread"""
         # Create logs directory if it doesn't exist
         log_dir = Path('logs')
         log_dir.mkdir(exist_ok=True)
@@ -62,7 +97,16 @@ class Logger:
         )
         
         file_handler.setFormatter(file_format)
-        self.logger.addHandler(file_handler)
+        
+        # Test threads only enqueue records; a listener thread does the formatting and writing
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(logging.DEBUG)
+        self.logger.addHandler(queue_handler)
+        
+        self._listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+        self._listener.start()
+        atexit.register(self._listener.stop)
     
     def debug(self, message: str):
         """Log debug message"""
@@ -3,13 +3,44 @@ Report Helper
 Utilities for generating and managing test reports
 """
 
+import array
 import json
 import os
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Tuple
+from jinja2 import Environment, FileSystemLoader
 from utils.logger import logger
 
+try:
+    import orjson
+    _json_encode = orjson.dumps
+except ImportError:
+    _json_encoder = json.JSONEncoder()
+    
+    def _json_encode(data: Any) -> bytes:
+        return _json_encoder.encode(data).encode('utf-8')
+
+
+def _isoformat(timestamp: float) -> str:
+    """Format an epoch timestamp recorded by add_test_result as ISO 8601 local time"""
+    return datetime.fromtimestamp(timestamp).isoformat()
+
+
+# Result fields in report order, one column per field
+_RESULT_FIELDS = ('test_name', 'status', 'duration', 'timestamp', 'error_message', 'screenshot')
+
+
+# HTML summary report template (utils/templates), compiled once at import
+_TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader(Path(__file__).parent / 'templates'),
+    autoescape=True,
+    trim_blocks=True,
+    keep_trailing_newline=True
+)
+_HTML_TEMPLATE = _TEMPLATE_ENV.get_template('summary_report.html.j2')
+
 
 class ReportHelper:
     """Helper class for test reporting"""
@@ -23,8 +54,8 @@ class ReportHelper:
         """
         self.report_dir = Path(report_dir)
         self.report_dir.mkdir(exist_ok=True)
-        self.test_results = []
-        logger.debug(f"ReportHelper initialized with dir: {report_dir}")
+        self._reset_columns()
+        logger.debug("ReportHelper initialized with dir: %s", report_dir)
     
     def add_test_result(self, test_name: str, status: str, 
                        duration: float = 0.0, 
@@ -40,16 +71,48 @@ class ReportHelper:
             error_message: Error message if failed
             screenshot_path: Path to screenshot if available
         """
-        result = {
-            'test_name': test_name,
-            'status': status,
-            'duration': round(duration, 2),
-            'timestamp': datetime.now().isoformat(),
-            'error_message': error_message,
-            'screenshot': screenshot_path
-        }
-        self.test_results.append(result)
-        logger.info(f"Added test result: {test_name} - {status}")
+        self._names.append(test_name)
+        self._statuses.append(status)
+        self._durations.append(round(duration, 2))
+        self._timestamps.append(time.time())
+        self._errors.append(error_message)
+        self._screenshots.append(screenshot_path)
+        logger.info("Added test result: %s - %s", test_name, status)
+    
+    def _reset_columns(self):
+        """Start empty result columns; timestamps stay epoch floats until a report is written"""
+        self._names: List[str] = []
+        self._statuses: List[str] = []
+        self._durations = array.array('d')
+        self._timestamps = array.array('d')
+        self._errors: List[str] = []
+        self._screenshots: List[str] = []
+    
+    def _rows(self):
+        """Iterate result rows as tuples in _RESULT_FIELDS order, with ISO 8601 timestamps"""
+        return zip(
+            self._names,
+            self._statuses,
+            self._durations,
+            map(_isoformat, self._timestamps),
+            self._errors,
+            self._screenshots
+        )
+    
+    @property
+    def test_results(self) -> Tuple[Dict[str, Any], ...]:
+        """
+        Read-only snapshot of the collected results, built from the result columns
+        
+        Results are stored column-wise, so this is a tuple rather than a live list:
+        record results with add_test_result and reset them with clear_results.
+        Mutating calls such as test_results.append(...) raise AttributeError
+        instead of silently changing a throwaway copy.
+        
+        Returns:
+            Tuple of result dictionaries
+        """
+        return tuple(dict(zip(_RESULT_FIELDS, row)) for row in self._rows())
     
     def generate_json_report(self, filename: str = None) -> str:
         """
@@ -67,16 +130,15 @@ class ReportHelper:
         
         report_path = self.report_dir / filename
         
-        report_data = {
-            'summary': self._generate_summary(),
-            'test_results': self.test_results,
-            'generated_at': datetime.now().isoformat()
-        }
+        # Stream one result at a time instead of building the whole report in memory
+        with open(report_path, 'wb') as f:
+            f.write(b'{"summary": ' + _json_encode(self._generate_summary()) + b',\n"test_results": [')
+            for i, row in enumerate(self._rows()):
+                f.write(b',\n' if i else b'\n')
+                f.write(_json_encode(dict(zip(_RESULT_FIELDS, row))))
+            f.write(b'\n],\n"generated_at": ' + _json_encode(datetime.now().isoformat()) + b'}\n')
         
-        with open(report_path, 'w') as f:
-            json.dump(report_data, f, indent=4)
-        
-        logger.info(f"JSON report generated: {report_path}")
+        logger.info("JSON report generated: %s", report_path)
         return str(report_path)
     
     def generate_html_summary(self, filename: str = None) -> str:
@@ -101,7 +163,7 @@ class ReportHelper:
         with open(report_path, 'w') as f:
             f.write(html_content)
         
-        logger.info(f"HTML summary generated: {report_path}")
+        logger.info("HTML summary generated: %s", report_path)
         return str(report_path)
     
     def _generate_summary(self) -> Dict[str, Any]:
@@ -111,12 +173,13 @@ class ReportHelper:
         Returns:
             Dictionary with summary data
         """
-        total = len(self.test_results)
-        passed = sum(1 for r in self.test_results if r['status'] == 'PASSED')
-        failed = sum(1 for r in self.test_results if r['status'] == 'FAILED')
-        skipped = sum(1 for r in self.test_results if r['status'] == 'SKIPPED')
+        statuses = self._statuses
+        total = len(statuses)
+        passed = statuses.count('PASSED')
+        failed = statuses.count('FAILED')
+        skipped = statuses.count('SKIPPED')
+        total_duration = sum(self._durations)
         
-        total_duration = sum(r['duration'] for r in self.test_results)
         pass_rate = (passed / total * 100) if total > 0 else 0
         
         return {
@@ -138,160 +201,11 @@ class ReportHelper:
         Returns:
             HTML string
         """
-        html = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Test Execution Summary</title>
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            margin: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background-color: white;
-            padding: 30px;
-            border-radius: 8px;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #333;
-            border-bottom: 3px solid #4CAF50;
-            padding-bottom: 10px;
-        }}
-        .summary {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin: 30px 0;
-        }}
-        .stat-card {{
-            padding: 20px;
-            border-radius: 8px;
-            text-align: center;
-            color: white;
-        }}
-        .stat-card.total {{ background-color: #2196F3; }}
-        .stat-card.passed {{ background-color: #4CAF50; }}
-        .stat-card.failed {{ background-color: #f44336; }}
-        .stat-card.skipped {{ background-color: #FF9800; }}
-        .stat-card.rate {{ background-color: #9C27B0; }}
-        .stat-card h2 {{
-            margin: 0;
-            font-size: 48px;
-        }}
-        .stat-card p {{
-            margin: 10px 0 0 0;
-            font-size: 16px;
-            opacity: 0.9;
-        }}
-        .test-list {{
-            margin-top: 30px;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 20px;
-        }}
-        th, td {{
-            padding: 12px;
-            text-align: left;
-            border-bottom: 1px solid #ddd;
-        }}
-        th {{
-            background-color: #4CAF50;
-            color: white;
-        }}
-        tr:hover {{
-            background-color: #f5f5f5;
-        }}
-        .status {{
-            padding: 4px 8px;
-            border-radius: 4px;
-            font-weight: bold;
-        }}
-        .status.passed {{ background-color: #4CAF50; color: white; }}
-        .status.failed {{ background-color: #f44336; color: white; }}
-        .status.skipped {{ background-color: #FF9800; color: white; }}
-        .footer {{
-            margin-top: 30px;
-            padding-top: 20px;
-            border-top: 1px solid #ddd;
-            text-align: center;
-            color: #666;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>Test Execution Summary</h1>
-        <p><strong>Generated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        
-        <div class="summary">
-            <div class="stat-card total">
-                <h2>{summary['total']}</h2>
-                <p>Total Tests</p>
-            </div>
-            <div class="stat-card passed">
-                <h2>{summary['passed']}</h2>
-                <p>Passed</p>
-            </div>
-            <div class="stat-card failed">
-                <h2>{summary['failed']}</h2>
-                <p>Failed</p>
-            </div>
-            <div class="stat-card skipped">
-                <h2>{summary['skipped']}</h2>
-                <p>Skipped</p>
-            </div>
-            <div class="stat-card rate">
-                <h2>{summary['pass_rate']}%</h2>
-                <p>Pass Rate</p>
-            </div>
-        </div>
-        
-        <div class="test-list">
-            <h2>Test Results</h2>
-            <table>
-                <thead>
-                    <tr>
-                        <th>Test Name</th>
-                        <th>Status</th>
-                        <th>Duration (s)</th>
-                        <th>Timestamp</th>
-                    </tr>
-                </thead>
-                <tbody>
-"""
-        
-        for result in self.test_results:
-            status_class = result['status'].lower()
-            html += f"""
-                    <tr>
-                        <td>{result['test_name']}</td>
-                        <td><span class="status {status_class}">{result['status']}</span></td>
-                        <td>{result['duration']}</td>
-                        <td>{result['timestamp']}</td>
-                    </tr>
-"""
-        
-        html += f"""
-                </tbody>
-            </table>
-        </div>
-        
-        <div class="footer">
-            <p>Total Execution Time: {summary['total_duration']} seconds</p>
-            <p>Selenium PyTest Framework - Automated Test Report</p>
-        </div>
-    </div>
-</body>
-</html>
-"""
-        return html
+        return _HTML_TEMPLATE.render(
+            summary=summary,
+            results=self.test_results,
+            generated_at=datetime.now()
+        )
     
     def get_failed_tests(self) -> List[Dict]:
         """
@@ -300,7 +214,7 @@ class ReportHelper:
         Returns:
             List of failed test results
         """
-        return [r for r in self.test_results if r['status'] == 'FAILED']
+        return self._results_with_status('FAILED')
     
     def get_passed_tests(self) -> List[Dict]:
         """
@@ -309,11 +223,21 @@ class ReportHelper:
         Returns:
             List of passed test results
         """
-        return [r for r in self.test_results if r['status'] == 'PASSED']
+        return self._results_with_status('PASSED')
+    
+    def _results_with_status(self, status: str) -> List[Dict]:
+        """Build result dictionaries only for the rows with the given status"""
+        if status not in self._statuses:
+            return []
+        return [
+            dict(zip(_RESULT_FIELDS, row))
+            for row_status, row in zip(self._statuses, self._rows())
+            if row_status == status
+        ]
     
     def clear_results(self):
         """Clear collected test results"""
-        self.test_results = []
+        self._reset_columns()
         logger.info("Test results cleared")
     
     def export_to_csv(self, filename: str = None) -> str:
@@ -335,12 +259,12 @@ class ReportHelper:
         report_path = self.report_dir / filename
         
         with open(report_path, 'w', newline='') as f:
-            if self.test_results:
-                writer = csv.DictWriter(f, fieldnames=self.test_results[0].keys())
-                writer.writeheader()
-                writer.writerows(self.test_results)
+            if self._statuses:
+                writer = csv.writer(f)
+                writer.writerow(_RESULT_FIELDS)
+                writer.writerows(self._rows())
         
-        logger.info(f"CSV report generated: {report_path}")
+        logger.info("CSV report generated: %s", report_path)
         return str(report_path)
 
 
@@ -3,13 +3,50 @@ Screenshot Utility
 Handles capturing and saving screenshots during test execution
 """
 
+import atexit
+import base64
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from selenium.webdriver.remote.webdriver import WebDriver
 from utils.logger import logger
 
 
+# Screenshot files are written off the test thread; pending writes are flushed at exit
+_IO_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="screenshot-io")
+atexit.register(_IO_POOL.shutdown, wait=True)
+
+# Chrome DevTools screenshot of the whole page, not just the viewport
+_CDP_FULL_PAGE_PARAMS = {'captureBeyondViewport': True, 'fromSurface': True, 'format': 'png'}
+
+# Full page dimensions in one round trip
+_PAGE_SIZE_JS = "return [document.body.scrollWidth, document.body.scrollHeight];"
+
+
+def _write_screenshot(png_bytes: bytes, screenshot_path: Path):
+    """Write captured screenshot bytes to disk (runs in the I/O pool)"""
+    try:
+        screenshot_path.write_bytes(png_bytes)
+        logger.info("Screenshot saved: %s", screenshot_path)
+    except Exception as e:
+        logger.error("Failed to save screenshot: %s", e)
+
+
+def save_png_async(png_bytes: bytes, screenshot_path: Path) -> Future:
+    """
+    Write already captured PNG bytes to disk in the background
+    
+    Args:
+        png_bytes: Screenshot image data
+        screenshot_path: File to write
+    
+    Returns:
+        Future that completes once the file is written
+    """
+    return _IO_POOL.submit(_write_screenshot, png_bytes, Path(screenshot_path))
+
+
 def capture_screenshot(driver: WebDriver, name: str = None, directory: str = "screenshots") -> str:
     """
     Capture screenshot and save to file
@@ -20,7 +57,7 @@ def capture_screenshot(driver: WebDriver, name: str = None, directory: str = "sc
         directory: Directory to save screenshot
     
     Returns:
-        Path to saved screenshot
+        Path the screenshot is written to (in the background)
     """
     # Create screenshots directory if it doesn't exist
     screenshot_dir = Path(directory)
@@ -37,12 +74,12 @@ def capture_screenshot(driver: WebDriver, name: str = None, directory: str = "sc
     screenshot_path = screenshot_dir / name
     
     try:
-        # Capture screenshot
-        driver.save_screenshot(str(screenshot_path))
-        logger.info(f"Screenshot captured: {screenshot_path}")
+        # Capture now, write in the background
+        save_png_async(driver.get_screenshot_as_png(), screenshot_path)
+        logger.info("Screenshot captured: %s", screenshot_path)
         return str(screenshot_path)
     except Exception as e:
-        logger.error(f"Failed to capture screenshot: {str(e)}")
+        logger.error("Failed to capture screenshot: %s", e)
         raise
 
 
@@ -57,7 +94,7 @@ def capture_element_screenshot(driver: WebDriver, element, name: str = None, dir
         directory: Directory to save screenshot
     
     Returns:
-        Path to saved screenshot
+        Path the screenshot is written to (in the background)
     """
     # Create screenshots directory
     screenshot_dir = Path(directory)
@@ -73,12 +110,12 @@ def capture_element_screenshot(driver: WebDriver, element, name: str = None, dir
     screenshot_path = screenshot_dir / name
     
     try:
-        # Capture element screenshot
-        element.screenshot(str(screenshot_path))
-        logger.info(f"Element screenshot captured: {screenshot_path}")
+        # Capture element screenshot now, write in the background
+        save_png_async(element.screenshot_as_png, screenshot_path)
+        logger.info("Element screenshot captured: %s", screenshot_path)
         return str(screenshot_path)
     except Exception as e:
-        logger.error(f"Failed to capture element screenshot: {str(e)}")
+        logger.error("Failed to capture element screenshot: %s", e)
         raise
 
 
@@ -92,7 +129,7 @@ def capture_full_page_screenshot(driver: WebDriver, name: str = None, directory:
         directory: Directory to save screenshot
     
     Returns:
-        Path to saved screenshot
+        Path the screenshot is written to (in the background)
     """
     # Create screenshots directory
     screenshot_dir = Path(directory)
@@ -107,27 +144,51 @@ def capture_full_page_screenshot(driver: WebDriver, name: str = None, directory:
     
     screenshot_path = screenshot_dir / name
     
+    if hasattr(driver, "execute_cdp_cmd"):
+        try:
+            # Chromium captures beyond the viewport itself, no window resize needed
+            result = driver.execute_cdp_cmd('Page.captureScreenshot', _CDP_FULL_PAGE_PARAMS)
+            save_png_async(base64.b64decode(result['data']), screenshot_path)
+            logger.info("Full page screenshot captured: %s", screenshot_path)
+            return str(screenshot_path)
+        except Exception as e:
+            logger.warning("CDP full page screenshot failed, resizing window instead: %s", e)
+    
+    return _capture_by_resizing(driver, screenshot_path)
+
+
+def _capture_by_resizing(driver: WebDriver, screenshot_path: Path) -> str:
+    """
+    Capture a full page screenshot by resizing the window to the page size
+    
+    Args:
+        driver: WebDriver instance
+        screenshot_path: File to save the screenshot to
+    
+    Returns:
+        Path to saved screenshot
+    """
     try:
         # Get original size
         original_size = driver.get_window_size()
         
         # Get full page dimensions
-        total_width = driver.execute_script("return document.body.scrollWidth")
-        total_height = driver.execute_script("return document.body.scrollHeight")
+        total_width, total_height = driver.execute_script(_PAGE_SIZE_JS)
         
         # Set window size to full page
         driver.set_window_size(total_width, total_height)
         
-        # Capture screenshot
-        driver.save_screenshot(str(screenshot_path))
+        # Capture screenshot (written in the background)
+        png_bytes = driver.get_screenshot_as_png()
         
         # Restore original window size
         driver.set_window_size(original_size['width'], original_size['height'])
+        save_png_async(png_bytes, screenshot_path)
         
-        logger.info(f"Full page screenshot captured: {screenshot_path}")
+        logger.info("Full page screenshot captured: %s", screenshot_path)
         return str(screenshot_path)
     except Exception as e:
-        logger.error(f"Failed to capture full page screenshot: {str(e)}")
+        logger.error("Failed to capture full page screenshot: %s", e)
         # Restore window size on error
         try:
             driver.set_window_size(original_size['width'], original_size['height'])
@@ -0,0 +1,22 @@
+"""
+Sorting Utility
+Order checks shared by the sorting tests
+"""
+
+import operator
+from typing import Sequence
+
+
+def is_sorted(values: Sequence, reverse: bool = False) -> bool:
+    """
+    Check order in one pass, without building a sorted copy
+    
+    Args:
+        values: Sequence to check
+        reverse: Expect descending instead of ascending order
+    
+    Returns:
+        True if every adjacent pair is in order
+    """
+    op = operator.ge if reverse else operator.le
+    return all(op(a, b) for a, b in zip(values, values[1:]))